@@ -2,45 +2,100 @@ from __future__ import annotations
 
 import argparse
 import json
-import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, TextIO, Tuple
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import sessionmaker
 
 # NOTE:
 # This import must match your project.
 # You already use this model in your API routes, so it should exist.
-from app.models.menu_item import MenuItem
+from app.core.config import get_settings
+from app.core.dietary import to_mask
+from app.models.menu_item import MenuItem, menu_content_hash
+from app.models.menu_item_version import MenuItemVersion
 
+REQUIRED = {"name", "description", "price_cents", "dietary_restrictions", "is_active"}
+READ_CHUNK = 64 * 1024
+NUMBER_CHARS = frozenset("0123456789.eE+-")
 
-def _get_db_url() -> str:
+
+def _iter_json_array(fp: TextIO) -> Iterator[Any]:
     """
-    Prefer env var DATABASE_URL / SQLALCHEMY_DATABASE_URI.
-    Fallback to the same Postgres URL you’ve been using in psql (local dev).
+    Yield the elements of a top-level JSON array one at a time.
+    Only the current element (plus one read chunk) is held in memory, so
+    catalog size doesn't matter.
     """
-    return (
-        os.getenv("DATABASE_URL")
-        or os.getenv("SQLALCHEMY_DATABASE_URI")
-        or "postgresql://joshdicker@localhost:5432/aaa"
-    )
-
-
-def _load_menu_items(json_path: Path) -> List[Dict[str, Any]]:
-    data = json.loads(json_path.read_text(encoding="utf-8"))
-
-    if not isinstance(data, list):
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        chunk = fp.read(READ_CHUNK)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip_ws() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos].isspace():
+                pos += 1
+            if pos < len(buf) or not fill():
+                return
+
+    skip_ws()
+    if pos >= len(buf) or buf[pos] != "[":
         raise ValueError("menu.json must be a JSON array of items.")
-
-    required = {"name", "description", "price_cents", "dietary_restrictions", "is_active"}
-    cleaned: List[Dict[str, Any]] = []
-
-    for idx, item in enumerate(data):
+    pos += 1
+
+    first = True
+    while True:
+        skip_ws()
+        if pos >= len(buf):
+            raise ValueError("Unexpected end of file inside the top-level array.")
+        if buf[pos] == "]":
+            return
+        if not first:
+            if buf[pos] != ",":
+                raise ValueError(f"Expected ',' between items, got {buf[pos]!r}.")
+            pos += 1
+            skip_ws()
+        first = False
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Element straddles the chunk boundary; read more and retry
+                if eof or not fill():
+                    raise
+                continue
+            if (
+                isinstance(value, (int, float)) and not isinstance(value, bool)
+                and (end == len(buf) or buf[end] in NUMBER_CHARS)
+                and not eof and fill()
+            ):
+                # A number may continue in the next chunk ("12" | "00", "-3" | ".5")
+                continue
+            pos = end
+            yield value
+            break
+
+
+def _load_menu_items(fp: TextIO) -> Iterator[Dict[str, Any]]:
+    for idx, item in enumerate(_iter_json_array(fp)):
         if not isinstance(item, dict):
             raise ValueError(f"Item #{idx} must be an object.")
 
-        missing = required - set(item.keys())
+        missing = REQUIRED - set(item.keys())
         if missing:
             raise ValueError(f"Item #{idx} missing keys: {sorted(missing)}")
 
@@ -54,48 +109,71 @@ def _load_menu_items(json_path: Path) -> List[Dict[str, Any]]:
         dietary = [str(x) for x in dietary]
         is_active = bool(item["is_active"])
 
-        cleaned.append(
-            {
-                "name": name,
-                "description": description,
-                "price_cents": price_cents,
-                "dietary_restrictions": dietary,  # SQLAlchemy JSON/JSONB expects Python list
-                "is_active": is_active,
-            }
-        )
-
-    return cleaned
-
-
-def _upsert_by_name(
-    session,
-    items: List[Dict[str, Any]],
-) -> Tuple[int, int]:
+        # Core INSERT bypasses the ORM flush events, so derived columns are set here
+        yield {
+            "name": name,
+            "description": description,
+            "price_cents": price_cents,
+            "dietary_restrictions": dietary,  # SQLAlchemy JSON/JSONB expects Python list
+            "dietary_mask": to_mask(dietary),
+            "is_active": is_active,
+            "content_hash": menu_content_hash(name, description, price_cents, dietary, is_active),
+        }
+
+
+def _chunks(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        # ON CONFLICT can't touch the same row twice in one statement: last one wins
+        batch.pop(row["name"], None)
+        batch[row["name"]] = row
+        if len(batch) >= size:
+            yield list(batch.values())
+            batch = {}
+    if batch:
+        yield list(batch.values())
+
+
+def _upsert_by_name(session, batch: List[Dict[str, Any]]) -> Tuple[int, int, int]:
     """
-    Upsert strategy:
-    - If MenuItem with same name exists: update fields
-    - Else: insert new row
-    Returns (inserted_count, updated_count)
+    One INSERT ... ON CONFLICT (name) DO UPDATE per batch.
+    Rows whose content_hash matches are left untouched (no write, no new
+    tuple, updated_at unchanged).
+    Returns (inserted_count, updated_count, unchanged_count)
     """
-    inserted = 0
-    updated = 0
-
-    for payload in items:
-        existing: Optional[MenuItem] = (
-            session.query(MenuItem).filter(MenuItem.name == payload["name"]).one_or_none()
+    stmt = insert(MenuItem).values(batch)
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MenuItem.name],
+        set_={
+            "description": excluded.description,
+            "price_cents": excluded.price_cents,
+            "dietary_restrictions": excluded.dietary_restrictions,
+            "dietary_mask": excluded.dietary_mask,
+            "is_active": excluded.is_active,
+            "content_hash": excluded.content_hash,
+            "updated_at": func.now(),  # onupdate= isn't applied to ON CONFLICT
+        },
+        where=MenuItem.content_hash.is_distinct_from(excluded.content_hash),
+    ).returning(MenuItem.name, literal_column("xmax = 0"))  # true → inserted, false → updated
+
+    written = session.execute(stmt).all()
+    inserted = sum(1 for _, was_insert in written if was_insert)
+    updated = len(written) - inserted
+
+    if written:
+        # Order items reference (name, price) versions; the ORM events that
+        # normally create them don't run for Core statements.
+        session.execute(
+            insert(MenuItemVersion)
+            .from_select(
+                ["menu_item_id", "name", "price_cents"],
+                select(MenuItem.id, MenuItem.name, MenuItem.price_cents)
+                .where(MenuItem.name.in_([name for name, _ in written])),
+            )
+            .on_conflict_do_nothing(constraint="uq_menu_item_versions_item_name_price")
         )
-
-        if existing:
-            existing.description = payload["description"]
-            existing.price_cents = payload["price_cents"]
-            existing.dietary_restrictions = payload["dietary_restrictions"]
-            existing.is_active = payload["is_active"]
-            updated += 1
-        else:
-            session.add(MenuItem(**payload))
-            inserted += 1
-
-    return inserted, updated
+    return inserted, updated, len(batch) - len(written)
 
 
 def main() -> int:
@@ -110,6 +188,12 @@ def main() -> int:
         action="store_true",
         help="Delete all rows from menu_items before importing (DANGEROUS).",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Rows per INSERT ... ON CONFLICT statement (default: 500)",
+    )
 
     args = parser.parse_args()
 
@@ -117,23 +201,24 @@ def main() -> int:
     if not json_path.exists():
         raise FileNotFoundError(f"menu JSON file not found: {json_path}")
 
-    db_url = _get_db_url()
-    engine = create_engine(db_url)
+    engine = create_engine(get_settings().DATABASE_URL)
     SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
-    items = _load_menu_items(json_path)
-
-    with SessionLocal() as session:
+    total = ins = upd = same = 0
+    with SessionLocal() as session, json_path.open(encoding="utf-8") as fp:
         if args.truncate:
-            session.query(MenuItem).delete()  # ok for dev; use TRUNCATE for large tables
-            session.commit()
+            session.execute(delete(MenuItem))  # ok for dev; use TRUNCATE for large tables
 
-        ins, upd = _upsert_by_name(session, items)
+        # Single transaction: a bad item midway leaves the table as it was
+        for batch in _chunks(_load_menu_items(fp), max(1, args.batch_size)):
+            i, u, s = _upsert_by_name(session, batch)
+            total += len(batch)
+            ins, upd, same = ins + i, upd + u, same + s
         session.commit()
 
-    print(f"Imported {len(items)} items → inserted={ins}, updated={upd}")
+    print(f"Imported {total} items → inserted={ins}, updated={upd}, unchanged={same}")
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
\ No newline at end of file
+    raise SystemExit(main())
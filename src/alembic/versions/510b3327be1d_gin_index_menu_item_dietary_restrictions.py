@@ -0,0 +1,35 @@
+"""gin index on menu_items.dietary_restrictions
+
+Revision ID: 510b3327be1d
+Revises: f2d45ba73bd8
+Create Date: 2026-10-19 11:26:52.804113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '510b3327be1d'
+down_revision: Union[str, Sequence[str], None] = 'f2d45ba73bd8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_menu_items_dietary_restrictions',
+        'menu_items',
+        ['dietary_restrictions'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'dietary_restrictions': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_menu_items_dietary_restrictions', table_name='menu_items', postgresql_using='gin')
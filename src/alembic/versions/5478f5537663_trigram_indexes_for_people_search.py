@@ -0,0 +1,44 @@
+"""trigram indexes for people search
+
+Revision ID: 5478f5537663
+Revises: c7611fb9d7df
+Create Date: 2026-10-19 15:31:06.774512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5478f5537663'
+down_revision: Union[str, Sequence[str], None] = 'c7611fb9d7df'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_members_name_trgm', 'members', [sa.text('lower(name) gin_trgm_ops')],
+        unique=False, postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_reservation_attendees_guest_name_trgm', 'reservation_attendees',
+        [sa.text('lower(guest_name) gin_trgm_ops')],
+        unique=False, postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_users_email_trgm', 'users', [sa.text('lower(email) gin_trgm_ops')],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_email_trgm', table_name='users')
+    op.drop_index('ix_reservation_attendees_guest_name_trgm', table_name='reservation_attendees')
+    op.drop_index('ix_members_name_trgm', table_name='members')
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,49 @@
+"""add dietary masks to menu items and attendees
+
+Revision ID: 8b08379212c5
+Revises: 510b3327be1d
+Create Date: 2026-10-19 13:20:41.902716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b08379212c5'
+down_revision: Union[str, Sequence[str], None] = '510b3327be1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Bit order as of this revision (app.core.dietary.DIETARY_RESTRICTIONS; append-only)
+BITS = "ARRAY['dairy_free','egg_free','fish_allergy','gluten_free','halal','kosher','nut_allergy','peanut_allergy','sesame_allergy','shellfish_allergy','soy_free','vegan','vegetarian']"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('menu_items', sa.Column('dietary_mask', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('reservation_attendees', sa.Column('dietary_mask', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(f"""
+        UPDATE menu_items SET dietary_mask = COALESCE((
+            SELECT bit_or(1 << (array_position({BITS}, v) - 1))
+            FROM jsonb_array_elements_text(dietary_restrictions) AS v
+            WHERE array_position({BITS}, v) IS NOT NULL
+        ), 0)
+        WHERE jsonb_typeof(dietary_restrictions) = 'array'
+    """)
+    op.execute(f"""
+        UPDATE reservation_attendees SET dietary_mask = COALESCE((
+            SELECT bit_or(1 << (array_position({BITS}, v::text) - 1))
+            FROM unnest(dietary_restrictions) AS v
+        ), 0)
+        WHERE dietary_restrictions IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('reservation_attendees', 'dietary_mask')
+    op.drop_column('menu_items', 'dietary_mask')
@@ -0,0 +1,44 @@
+"""unique menu item name and content hash
+
+Revision ID: 8bd933bdde56
+Revises: 8b08379212c5
+Create Date: 2026-10-19 14:02:17.448130
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8bd933bdde56'
+down_revision: Union[str, Sequence[str], None] = '8b08379212c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing duplicates can't be deleted (order_items reference them), so
+    # every copy after the oldest is renamed "<name> (#<id>)".
+    op.execute("""
+        UPDATE menu_items m
+        SET name = left(m.name, 140 - length(' (#' || m.id || ')')) || ' (#' || m.id || ')'
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY name ORDER BY id) AS rn
+            FROM menu_items
+        ) d
+        WHERE d.id = m.id AND d.rn > 1
+    """)
+    op.drop_index(op.f('ix_menu_items_name'), table_name='menu_items')
+    op.create_index(op.f('ix_menu_items_name'), 'menu_items', ['name'], unique=True)
+    # Left NULL: the first import (or admin edit) computes it
+    op.add_column('menu_items', sa.Column('content_hash', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('menu_items', 'content_hash')
+    op.drop_index(op.f('ix_menu_items_name'), table_name='menu_items')
+    op.create_index(op.f('ix_menu_items_name'), 'menu_items', ['name'], unique=False)
@@ -0,0 +1,110 @@
+"""menu item versions replace order item snapshots
+
+Revision ID: c7611fb9d7df
+Revises: 8bd933bdde56
+Create Date: 2026-10-19 14:48:53.207615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7611fb9d7df'
+down_revision: Union[str, Sequence[str], None] = '8bd933bdde56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Read-only stand-in with the pre-versioning order_items columns, for reports
+# and ad-hoc SQL that still select name_snapshot / price_cents_snapshot.
+COMPAT_VIEW = """
+    CREATE VIEW order_items_with_snapshots AS
+    SELECT oi.id, oi.order_id, oi.menu_item_id, oi.quantity, oi.status,
+           v.name AS name_snapshot, v.price_cents AS price_cents_snapshot,
+           oi.meta, oi.created_at, oi.updated_at, oi.served_at,
+           oi.menu_item_version_id
+    FROM order_items oi
+    JOIN menu_item_versions v ON v.id = oi.menu_item_version_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('menu_item_versions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('menu_item_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=140), nullable=False),
+    sa.Column('price_cents', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text("TIMEZONE('utc', now())"), nullable=False),
+    sa.ForeignKeyConstraint(['menu_item_id'], ['menu_items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('menu_item_id', 'name', 'price_cents', name='uq_menu_item_versions_item_name_price')
+    )
+    op.create_index(op.f('ix_menu_item_versions_price_cents'), 'menu_item_versions', ['price_cents'], unique=False)
+
+    # Every distinct (item, name, price) ever ordered, oldest first, then the
+    # current menu row. NULL snapshots fall back to the menu item's values.
+    op.execute("""
+        INSERT INTO menu_item_versions (menu_item_id, name, price_cents, created_at)
+        SELECT oi.menu_item_id,
+               COALESCE(oi.name_snapshot, m.name),
+               COALESCE(oi.price_cents_snapshot, m.price_cents),
+               MIN(oi.created_at)
+        FROM order_items oi
+        JOIN menu_items m ON m.id = oi.menu_item_id
+        GROUP BY 1, 2, 3
+        ORDER BY 4
+        ON CONFLICT ON CONSTRAINT uq_menu_item_versions_item_name_price DO NOTHING
+    """)
+    op.execute("""
+        INSERT INTO menu_item_versions (menu_item_id, name, price_cents)
+        SELECT id, name, price_cents FROM menu_items
+        ON CONFLICT ON CONSTRAINT uq_menu_item_versions_item_name_price DO NOTHING
+    """)
+
+    op.add_column('order_items', sa.Column('menu_item_version_id', sa.Integer(), nullable=True))
+    op.execute("""
+        UPDATE order_items oi
+        SET menu_item_version_id = v.id
+        FROM menu_items m, menu_item_versions v
+        WHERE m.id = oi.menu_item_id
+          AND v.menu_item_id = oi.menu_item_id
+          AND v.name = COALESCE(oi.name_snapshot, m.name)
+          AND v.price_cents = COALESCE(oi.price_cents_snapshot, m.price_cents)
+    """)
+    op.alter_column('order_items', 'menu_item_version_id', nullable=False)
+    op.create_foreign_key(
+        'order_items_menu_item_version_id_fkey', 'order_items', 'menu_item_versions',
+        ['menu_item_version_id'], ['id'], ondelete='RESTRICT',
+    )
+    op.create_index(op.f('ix_order_items_menu_item_version_id'), 'order_items', ['menu_item_version_id'], unique=False)
+
+    op.drop_column('order_items', 'price_cents_snapshot')
+    op.drop_column('order_items', 'name_snapshot')
+
+    op.execute(COMPAT_VIEW)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP VIEW IF EXISTS order_items_with_snapshots")
+
+    op.add_column('order_items', sa.Column('name_snapshot', sa.String(length=140), nullable=True))
+    op.add_column('order_items', sa.Column('price_cents_snapshot', sa.Integer(), nullable=True))
+    op.execute("""
+        UPDATE order_items oi
+        SET name_snapshot = v.name, price_cents_snapshot = v.price_cents
+        FROM menu_item_versions v
+        WHERE v.id = oi.menu_item_version_id
+    """)
+    op.alter_column('order_items', 'name_snapshot', nullable=False)
+    op.alter_column('order_items', 'price_cents_snapshot', nullable=False)
+
+    op.drop_index(op.f('ix_order_items_menu_item_version_id'), table_name='order_items')
+    op.drop_constraint('order_items_menu_item_version_id_fkey', 'order_items', type_='foreignkey')
+    op.drop_column('order_items', 'menu_item_version_id')
+
+    op.drop_index(op.f('ix_menu_item_versions_price_cents'), table_name='menu_item_versions')
+    op.drop_table('menu_item_versions')
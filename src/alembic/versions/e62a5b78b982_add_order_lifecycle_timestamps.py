@@ -0,0 +1,36 @@
+"""add order lifecycle timestamps
+
+Revision ID: e62a5b78b982
+Revises: 1deddf9967eb
+Create Date: 2026-10-19 09:12:40.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e62a5b78b982'
+down_revision: Union[str, Sequence[str], None] = '1deddf9967eb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('fired_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('orders', sa.Column('fulfilled_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_orders_fired_at'), 'orders', ['fired_at'], unique=False)
+    op.add_column('order_items', sa.Column('served_at', sa.DateTime(timezone=True), nullable=True))
+    # No backfill: updated_at is not a reliable fire/fulfil time, and guessed
+    # values would skew the ticket-time percentiles. History starts here.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('order_items', 'served_at')
+    op.drop_index(op.f('ix_orders_fired_at'), table_name='orders')
+    op.drop_column('orders', 'fulfilled_at')
+    op.drop_column('orders', 'fired_at')
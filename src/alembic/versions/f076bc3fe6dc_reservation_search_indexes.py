@@ -0,0 +1,44 @@
+"""reservation code-prefix and full-text search indexes
+
+Revision ID: f076bc3fe6dc
+Revises: 5478f5537663
+Create Date: 2026-10-19 16:05:48.120937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f076bc3fe6dc'
+down_revision: Union[str, Sequence[str], None] = '5478f5537663'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_reservations_reservation_code_pattern', 'reservations',
+        [sa.text('reservation_code text_pattern_ops')], unique=False,
+    )
+    # Expressions must match app.models.reservation.fts_vector() exactly
+    op.create_index(
+        'ix_reservations_notes_fts', 'reservations',
+        [sa.text("to_tsvector('simple'::regconfig, coalesce(notes, ''))")],
+        unique=False, postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_reservation_attendees_guest_name_fts', 'reservation_attendees',
+        [sa.text("to_tsvector('simple'::regconfig, coalesce(guest_name, ''))")],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reservation_attendees_guest_name_fts', table_name='reservation_attendees')
+    op.drop_index('ix_reservations_notes_fts', table_name='reservations')
+    op.drop_index('ix_reservations_reservation_code_pattern', table_name='reservations')
@@ -0,0 +1,31 @@
+"""add row versions to orders and reservations
+
+Revision ID: f2d45ba73bd8
+Revises: e62a5b78b982
+Create Date: 2026-10-19 10:03:15.527731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2d45ba73bd8'
+down_revision: Union[str, Sequence[str], None] = 'e62a5b78b982'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # server_default backfills existing rows with version 1
+    op.add_column('orders', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('reservations', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('reservations', 'version')
+    op.drop_column('orders', 'version')
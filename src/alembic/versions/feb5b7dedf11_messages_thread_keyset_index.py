@@ -0,0 +1,34 @@
+"""messages (reservation_id, created_at, id) keyset index
+
+Revision ID: feb5b7dedf11
+Revises: f076bc3fe6dc
+Create Date: 2026-10-19 16:48:12.304518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'feb5b7dedf11'
+down_revision: Union[str, Sequence[str], None] = 'f076bc3fe6dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_messages_reservation_id_created_at_id', 'messages',
+        ['reservation_id', 'created_at', 'id'], unique=False,
+    )
+    # Leading column of the composite index covers it
+    op.drop_index(op.f('ix_messages_reservation_id'), table_name='messages')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_messages_reservation_id'), 'messages', ['reservation_id'], unique=False)
+    op.drop_index('ix_messages_reservation_id_created_at_id', table_name='messages')
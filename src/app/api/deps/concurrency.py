@@ -0,0 +1,65 @@
+# app/api/deps/concurrency.py
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import Header, HTTPException, Response, status
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+# Optimistic concurrency for versioned rows (Order, Reservation).
+# The ETag is the row's version; PATCH must send it back in If-Match.
+# The version check itself happens in the UPDATE emitted by the ORM
+# (mapper version_id_col): UPDATE ... WHERE id = ? AND version = ?
+
+
+def etag_for(version: int) -> str:
+    return f'"{version}"'
+
+
+def set_etag(response: Response, version: int) -> None:
+    response.headers["ETag"] = etag_for(version)
+
+
+def require_if_match(
+    if_match: Optional[str] = Header(None, alias="If-Match"),
+) -> Optional[int]:
+    """
+    Parse If-Match into the expected version.
+    Returns None for "*" (any version). Missing header → 428.
+    """
+    if not if_match:
+        raise HTTPException(
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+            detail="If-Match header is required",
+        )
+    value = if_match.strip()
+    if value == "*":
+        return None
+    if value.startswith("W/"):
+        value = value[2:]
+    try:
+        return int(value.strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Malformed If-Match header")
+
+
+def check_version(current: int, expected: Optional[int]) -> None:
+    if expected is not None and current != expected:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Resource was modified by someone else; reload and retry",
+            headers={"ETag": etag_for(current)},
+        )
+
+
+def commit_versioned(db: Session) -> None:
+    """Commit; a concurrent writer that bumped the version first turns into 412."""
+    try:
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Resource was modified by someone else; reload and retry",
+        )
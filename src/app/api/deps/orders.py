@@ -0,0 +1,91 @@
+# app/api/deps/orders.py
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.order import Order
+from app.models.reservation import Reservation
+from app.models.reservation_attendee import ReservationAttendee
+from app.models.user import User
+
+# Key under Session.info; the session lives for exactly one request (get_db),
+# so anything memoized here is dropped when the request ends.
+_MEMO_KEY = "order_access"
+
+
+class OrderAccess(NamedTuple):
+    """Ownership + lifecycle facts for one attendee/order, fetched in a single round trip."""
+    attendee_id: int
+    reservation_id: int
+    owner_user_id: int
+    order_id: Optional[int]
+    order_status: Optional[str]
+
+    @property
+    def is_locked(self) -> bool:
+        return self.order_status in ("fired", "fulfilled")
+
+
+def _memo(db: Session) -> dict:
+    return db.info.setdefault(_MEMO_KEY, {})
+
+
+def _access_query():
+    return (
+        select(
+            ReservationAttendee.id,
+            ReservationAttendee.reservation_id,
+            Reservation.user_id,
+            Order.id,
+            Order.status,
+        )
+        .select_from(ReservationAttendee)
+        .join(Reservation, Reservation.id == ReservationAttendee.reservation_id)
+        .outerjoin(Order, Order.attendee_id == ReservationAttendee.id)
+    )
+
+
+def _remember(db: Session, access: OrderAccess) -> OrderAccess:
+    memo = _memo(db)
+    memo[("attendee", access.attendee_id)] = access
+    if access.order_id is not None:
+        memo[("order", access.order_id)] = access
+    return access
+
+
+def _check_owner(user: User, access: OrderAccess) -> OrderAccess:
+    if access.owner_user_id != user.id and user.role not in ("admin", "staff"):
+        raise HTTPException(status_code=403, detail="Not allowed")
+    return access
+
+
+def require_order_access(db: Session, user: User, order_id: int) -> OrderAccess:
+    """
+    Resolve order → attendee → reservation owner in one joined SELECT and
+    enforce ownership (staff/admin bypass). Memoized for the rest of the request.
+    """
+    access = _memo(db).get(("order", order_id))
+    if access is None:
+        row = db.execute(_access_query().where(Order.id == order_id)).one_or_none()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Order not found")
+        access = _remember(db, OrderAccess(*row))
+    return _check_owner(user, access)
+
+
+def require_attendee_access(db: Session, user: User, attendee_id: int) -> OrderAccess:
+    """Same as require_order_access, keyed by attendee (order fields are None if no order yet)."""
+    access = _memo(db).get(("attendee", attendee_id))
+    if access is None:
+        row = db.execute(
+            _access_query().where(ReservationAttendee.id == attendee_id)
+        ).one_or_none()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Attendee not found")
+        access = _remember(db, OrderAccess(*row))
+    return _check_owner(user, access)
+
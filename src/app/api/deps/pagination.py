@@ -0,0 +1,161 @@
+# app/api/deps/pagination.py
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import date, datetime, time
+from typing import Any, List, NamedTuple, Optional, Sequence, Type
+
+from fastapi import HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.orm import Session
+
+# Keyset pagination for list endpoints.
+#
+# Opt-in: without ?limit= or ?cursor= the full list comes back as before.
+# The response body stays a plain JSON array; paging metadata travels in headers:
+#   X-Next-Cursor  — pass back as ?cursor= for the next page (absent on the last page)
+#   X-Total-Count  — only with ?include_total=true (costs a COUNT(*))
+#
+# The cursor is the sort key of the last row returned, so page N+1 is an index
+# range scan (WHERE (k1, k2) > (:v1, :v2) ORDER BY k1, k2 LIMIT n) rather than
+# OFFSET over everything before it. Sort keys must end in a unique column.
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 500
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+class PageParams(NamedTuple):
+    limit: Optional[int]        # None: no paging, return every row
+    cursor: Optional[str]
+    include_total: bool
+
+
+def page_params(
+    limit: Optional[int] = Query(
+        None, ge=1, le=MAX_LIMIT,
+        description=f"Page size; enables paging (default {DEFAULT_LIMIT} when only cursor is given)",
+    ),
+    cursor: Optional[str] = Query(None, description=f"Opaque; from the {NEXT_CURSOR_HEADER} header"),
+    include_total: bool = Query(False, description=f"Return {TOTAL_COUNT_HEADER}"),
+) -> PageParams:
+    if limit is None and cursor is not None:
+        limit = DEFAULT_LIMIT
+    return PageParams(limit, cursor, include_total)
+
+
+def field_params(
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return"),
+) -> Optional[List[str]]:
+    if fields is None:
+        return None
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    if not names:
+        raise HTTPException(status_code=422, detail="fields must name at least one column")
+    return list(dict.fromkeys(names))
+
+
+def _encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, (date, time)) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, keys: Sequence[Any]) -> List[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError
+        decoded = []
+        for key, value in zip(keys, values):
+            py_type = key.type.python_type
+            if py_type in (datetime, date, time):
+                value = py_type.fromisoformat(value)
+            elif not isinstance(value, py_type):
+                raise ValueError
+            decoded.append(value)
+        return decoded
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate(
+    db: Session,
+    stmt: Select,
+    *,
+    order_by: Sequence[Any],
+    page: PageParams,
+    response: Response,
+    descending: bool = False,
+    fields: Optional[List[str]] = None,
+    schema: Optional[Type[BaseModel]] = None,
+    options: Sequence[Any] = (),
+):
+    """
+    Run one page of `stmt` (a select() of a single mapped entity, filters applied).
+
+    Without `fields`: returns the ORM objects (the route's response_model applies).
+    With `fields`: selects only those columns (plus the sort keys) through Core
+    and returns a JSONResponse of dicts. Allowed names are the entity's table
+    columns, narrowed to `schema`'s fields when given so projection never
+    exposes more than the full response would.
+    """
+    entity = stmt.column_descriptions[0]["entity"]
+    table = entity.__table__
+
+    total = None
+    if page.include_total:
+        total = db.execute(
+            select(func.count()).select_from(stmt.order_by(None).subquery())
+        ).scalar_one()
+
+    keys = list(order_by)
+    if page.cursor:
+        after = tuple_(*keys) < tuple_(*_decode_cursor(page.cursor, keys)) if descending \
+            else tuple_(*keys) > tuple_(*_decode_cursor(page.cursor, keys))
+        stmt = stmt.where(after)
+    stmt = stmt.order_by(None).order_by(*(k.desc() if descending else k.asc() for k in keys))
+    key_labels = [k.label(f"_page_key_{i}") for i, k in enumerate(keys)]
+
+    if fields is None:
+        stmt = stmt.options(*options).add_columns(*key_labels)
+        if page.limit is not None:
+            stmt = stmt.limit(page.limit + 1)
+        rows = db.execute(stmt).all()
+        items = [row[0] for row in rows[: page.limit]]
+    else:
+        allowed = [c.key for c in table.columns]
+        if schema is not None:
+            allowed = [name for name in allowed if name in schema.model_fields]
+        unknown = [f for f in fields if f not in allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unknown fields: {unknown}. Allowed: {allowed}",
+            )
+        stmt = stmt.with_only_columns(
+            *(table.c[f] for f in fields), *key_labels, maintain_column_froms=True
+        )
+        if page.limit is not None:
+            stmt = stmt.limit(page.limit + 1)
+        rows = db.execute(stmt).all()
+        items = [{f: row._mapping[table.c[f]] for f in fields} for row in rows[: page.limit]]
+
+    headers = {}
+    if page.limit is not None and len(rows) > page.limit:
+        last = rows[page.limit - 1]._mapping
+        headers[NEXT_CURSOR_HEADER] = _encode_cursor([last[label.name] for label in key_labels])
+    if total is not None:
+        headers[TOTAL_COUNT_HEADER] = str(total)
+
+    if fields is None:
+        response.headers.update(headers)
+        return items
+    return JSONResponse(content=jsonable_encoder(items), headers=headers)
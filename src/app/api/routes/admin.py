@@ -1,20 +1,38 @@
 # app/api/routes/admin.py
 from __future__ import annotations
 
-from datetime import date
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query
+import json
+import re
+from datetime import date, time, timedelta
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import case, distinct, func, insert, literal, null, or_, select, text, true, union_all
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, selectinload
 
 from app.api.deps.auth import hash_password, get_current_user
+from app.api.deps.concurrency import check_version, commit_versioned, require_if_match, set_etag
 from app.api.deps.db import get_db
+from app.api.deps.pagination import (
+    NEXT_CURSOR_HEADER,
+    TOTAL_COUNT_HEADER,
+    PageParams,
+    field_params,
+    page_params,
+    paginate,
+)
+from app.core.dietary import from_mask
+from app.core.http_cache import etag_for_bytes, json_bytes_response
 from app.models.dining_room import DiningRoom
 from app.models.member import Member
 from app.models.menu_item import MenuItem
+from app.models.menu_item_version import MenuItemVersion
 from app.models.message import Message
 from app.models.order import Order
-from app.models.reservation import Reservation
+from app.models.order_item import OrderItem
+from app.models.reservation import Reservation, fts_vector
 from app.models.reservation_attendee import ReservationAttendee
 from app.models.seat_assignment import SeatAssignment
 from app.models.table import Table
@@ -22,13 +40,22 @@ from app.models.user import User
 from app.schemas.dining_room import DiningRoomCreate, DiningRoomRead
 from app.schemas.member import MemberCreate, MemberRead, MemberUpdate
 from app.schemas.menu_item import MenuItemCreate, MenuItemResponse, MenuItemUpdate
+from app.schemas.messages import MessageBroadcast
 from app.schemas.orders import OrderResponse
 from app.schemas.reservation import ReservationCreate, ReservationRead, ReservationUpdate
 from app.schemas.table import TableCreate, TableRead
 from app.schemas.user import UserCreate, UserRead, UserUpdate
+from app.services import bulk
+from app.services.board_cache import board_cache
+from app.services.menu_catalog import menu_catalog
+from app.services.message_bus import date_topic, message_bus, reservation_topic
+from app.services.single_flight import request_key, single_flight
+from app.services.table_capacity import table_capacity
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+_order_list = TypeAdapter(List[OrderResponse])
+
 
 def require_admin(user: User = Depends(get_current_user)) -> User:
     if user.role not in ("admin", "staff"):
@@ -41,10 +68,16 @@ def require_admin(user: User = Depends(get_current_user)) -> User:
 
 @router.get("/users", response_model=List[UserRead])
 def admin_list_users(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    fields: Optional[List[str]] = Depends(field_params),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    return db.query(User).order_by(User.id.asc()).all()
+    return paginate(
+        db, select(User), order_by=[User.id],
+        page=page, response=response, fields=fields, schema=UserRead,
+    )
 
 
 @router.get("/users/{user_id}", response_model=UserRead)
@@ -121,10 +154,16 @@ def admin_delete_user(
 
 @router.get("/members", response_model=List[MemberRead])
 def admin_list_members(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    fields: Optional[List[str]] = Depends(field_params),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    return db.query(Member).order_by(Member.id.asc()).all()
+    return paginate(
+        db, select(Member), order_by=[Member.id],
+        page=page, response=response, fields=fields, schema=MemberRead,
+    )
 
 
 @router.get("/members/{member_id}", response_model=MemberRead)
@@ -185,10 +224,8 @@ def admin_delete_member(
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    member = db.get(Member, member_id)
-    if not member:
+    if not bulk.delete_member(db, member_id)["members"]:
         raise HTTPException(status_code=404, detail="Member not found")
-    db.delete(member)
     db.commit()
     return None
 
@@ -199,31 +236,39 @@ def admin_delete_member(
 
 @router.get("/reservations", response_model=List[ReservationRead])
 def admin_list_reservations(
+    response: Response,
     status: Optional[str] = Query(None),
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
+    page: PageParams = Depends(page_params),
+    fields: Optional[List[str]] = Depends(field_params),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    q = db.query(Reservation)
+    stmt = select(Reservation)
     if status:
-        q = q.filter(Reservation.status == status)
+        stmt = stmt.where(Reservation.status == status)
     if from_date:
-        q = q.filter(Reservation.date >= from_date)
+        stmt = stmt.where(Reservation.date >= from_date)
     if to_date:
-        q = q.filter(Reservation.date <= to_date)
-    return q.order_by(Reservation.date.asc(), Reservation.start_time.asc()).all()
+        stmt = stmt.where(Reservation.date <= to_date)
+    return paginate(
+        db, stmt, order_by=[Reservation.date, Reservation.start_time, Reservation.id],
+        page=page, response=response, fields=fields, schema=ReservationRead,
+    )
 
 
 @router.get("/reservations/{reservation_id}", response_model=ReservationRead)
 def admin_get_reservation(
     reservation_id: int,
+    response: Response,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
     reservation = db.get(Reservation, reservation_id)
     if not reservation:
         raise HTTPException(status_code=404, detail="Reservation not found")
+    set_etag(response, reservation.version)
     return reservation
 
 
@@ -256,17 +301,21 @@ def admin_create_reservation(
 def admin_update_reservation(
     reservation_id: int,
     payload: ReservationUpdate,
+    response: Response,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
+    expected_version: Optional[int] = Depends(require_if_match),
 ):
     reservation = db.get(Reservation, reservation_id)
     if not reservation:
         raise HTTPException(status_code=404, detail="Reservation not found")
+    check_version(reservation.version, expected_version)
     data = payload.model_dump(exclude_unset=True)
     for k, v in data.items():
         setattr(reservation, k, v)
-    db.commit()
+    commit_versioned(db)
     db.refresh(reservation)
+    set_etag(response, reservation.version)
     return reservation
 
 
@@ -341,14 +390,20 @@ def admin_reservation_bootstrap(
 
 @router.get("/attendees")
 def admin_list_attendees(
+    response: Response,
     reservation_id: Optional[int] = Query(None),
+    page: PageParams = Depends(page_params),
+    fields: Optional[List[str]] = Depends(field_params),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    q = db.query(ReservationAttendee)
+    stmt = select(ReservationAttendee)
     if reservation_id:
-        q = q.filter(ReservationAttendee.reservation_id == reservation_id)
-    return q.order_by(ReservationAttendee.id.asc()).all()
+        stmt = stmt.where(ReservationAttendee.reservation_id == reservation_id)
+    return paginate(
+        db, stmt, order_by=[ReservationAttendee.id],
+        page=page, response=response, fields=fields,
+    )
 
 
 @router.patch("/attendees/{attendee_id}")
@@ -391,16 +446,20 @@ def admin_delete_attendee(
 def admin_patch_order(
     order_id: int,
     payload: dict,
+    response: Response,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
+    expected_version: Optional[int] = Depends(require_if_match),
 ):
     order = db.get(Order, order_id)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
+    check_version(order.version, expected_version)
     if "status" in payload:
         order.status = payload["status"]
-    db.commit()
+    commit_versioned(db)
     db.refresh(order)
+    set_etag(response, order.version)
     return order
 
 
@@ -410,10 +469,16 @@ def admin_patch_order(
 
 @router.get("/menu-items", response_model=List[MenuItemResponse])
 def admin_list_menu_items(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    fields: Optional[List[str]] = Depends(field_params),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    return db.query(MenuItem).order_by(MenuItem.id.asc()).all()
+    return paginate(
+        db, select(MenuItem), order_by=[MenuItem.id],
+        page=page, response=response, fields=fields, schema=MenuItemResponse,
+    )
 
 
 @router.post("/menu-items", response_model=MenuItemResponse, status_code=201)
@@ -424,7 +489,12 @@ def admin_create_menu_item(
 ):
     item = MenuItem(**payload.model_dump())
     db.add(item)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="A menu item with that name already exists")
+    menu_catalog.invalidate()
     db.refresh(item)
     return item
 
@@ -442,7 +512,12 @@ def admin_update_menu_item(
     data = payload.model_dump(exclude_unset=True)
     for k, v in data.items():
         setattr(item, k, v)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="A menu item with that name already exists")
+    menu_catalog.invalidate()
     db.refresh(item)
     return item
 
@@ -458,6 +533,7 @@ def admin_delete_menu_item(
         raise HTTPException(status_code=404, detail="Menu item not found")
     db.delete(item)
     db.commit()
+    menu_catalog.invalidate()
     return None
 
 
@@ -472,20 +548,67 @@ def admin_toggle_menu_item(
         raise HTTPException(status_code=404, detail="Menu item not found")
     item.is_active = not item.is_active
     db.commit()
+    menu_catalog.invalidate()
     db.refresh(item)
     return item
 
 
+@router.get("/menu-items/{item_id}/versions")
+def admin_menu_item_versions(
+    item_id: int,
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    # Orders by price point: each (name, price) the item has had, with what was
+    # ordered at it. Lines are counted through ix_order_items_menu_item_version_id.
+    if not db.get(MenuItem, item_id):
+        raise HTTPException(status_code=404, detail="Menu item not found")
+
+    stmt = (
+        select(
+            MenuItemVersion.id,
+            MenuItemVersion.name,
+            MenuItemVersion.price_cents,
+            MenuItemVersion.created_at,
+            func.count(OrderItem.id).label("lines"),
+            func.coalesce(func.sum(OrderItem.quantity), 0).label("quantity"),
+        )
+        .outerjoin(
+            OrderItem,
+            (OrderItem.menu_item_version_id == MenuItemVersion.id) & (OrderItem.status != "canceled"),
+        )
+        .where(MenuItemVersion.menu_item_id == item_id)
+        .group_by(MenuItemVersion.id)
+        .order_by(MenuItemVersion.created_at.asc(), MenuItemVersion.id.asc())
+    )
+    return [
+        {
+            "version_id": version_id,
+            "name": name,
+            "price_cents": price_cents,
+            "created_at": created_at,
+            "order_lines": lines,
+            "quantity": quantity,
+        }
+        for version_id, name, price_cents, created_at, lines, quantity in db.execute(stmt)
+    ]
+
 # ══════════════════════════════════════════════
 # DINING ROOMS
 # ══════════════════════════════════════════════
 
 @router.get("/dining-rooms", response_model=List[DiningRoomRead])
 def admin_list_dining_rooms(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    fields: Optional[List[str]] = Depends(field_params),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    return db.query(DiningRoom).order_by(DiningRoom.id.asc()).all()
+    return paginate(
+        db, select(DiningRoom), order_by=[DiningRoom.id],
+        page=page, response=response, fields=fields, schema=DiningRoomRead,
+    )
 
 
 @router.post("/dining-rooms", response_model=DiningRoomRead, status_code=201)
@@ -525,11 +648,10 @@ def admin_delete_dining_room(
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    room = db.get(DiningRoom, room_id)
-    if not room:
+    if not bulk.delete_dining_room(db, room_id)["dining_rooms"]:
         raise HTTPException(status_code=404, detail="Dining room not found")
-    db.delete(room)
     db.commit()
+    table_capacity.invalidate()
     return None
 
 
@@ -539,12 +661,10 @@ def admin_toggle_dining_room(
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    room = db.get(DiningRoom, room_id)
+    room = bulk.toggle_active(db, DiningRoom, room_id)
     if not room:
         raise HTTPException(status_code=404, detail="Dining room not found")
-    room.is_active = not room.is_active
     db.commit()
-    db.refresh(room)
     return room
 
 
@@ -554,14 +674,20 @@ def admin_toggle_dining_room(
 
 @router.get("/tables", response_model=List[TableRead])
 def admin_list_tables(
+    response: Response,
     dining_room_id: Optional[int] = Query(None),
+    page: PageParams = Depends(page_params),
+    fields: Optional[List[str]] = Depends(field_params),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    q = db.query(Table)
+    stmt = select(Table)
     if dining_room_id:
-        q = q.filter(Table.dining_room_id == dining_room_id)
-    return q.order_by(Table.dining_room_id.asc(), Table.id.asc()).all()
+        stmt = stmt.where(Table.dining_room_id == dining_room_id)
+    return paginate(
+        db, stmt, order_by=[Table.dining_room_id, Table.id],
+        page=page, response=response, fields=fields, schema=TableRead,
+    )
 
 
 @router.post("/tables", response_model=TableRead, status_code=201)
@@ -573,6 +699,7 @@ def admin_create_table(
     table = Table(**payload.model_dump())
     db.add(table)
     db.commit()
+    table_capacity.invalidate()
     db.refresh(table)
     return table
 
@@ -591,6 +718,7 @@ def admin_update_table(
     for k, v in data.items():
         setattr(table, k, v)
     db.commit()
+    table_capacity.invalidate()
     db.refresh(table)
     return table
 
@@ -601,11 +729,10 @@ def admin_delete_table(
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    table = db.get(Table, table_id)
-    if not table:
+    if not bulk.delete_table(db, table_id)["tables"]:
         raise HTTPException(status_code=404, detail="Table not found")
-    db.delete(table)
     db.commit()
+    table_capacity.invalidate()
     return None
 
 
@@ -615,12 +742,11 @@ def admin_toggle_table(
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    table = db.get(Table, table_id)
+    table = bulk.toggle_active(db, Table, table_id)
     if not table:
         raise HTTPException(status_code=404, detail="Table not found")
-    table.is_active = not table.is_active
     db.commit()
-    db.refresh(table)
+    table_capacity.invalidate()
     return table
 
 
@@ -630,26 +756,50 @@ def admin_toggle_table(
 
 @router.get("/orders", response_model=List[OrderResponse])
 def admin_list_orders(
+    request: Request,
     status: Optional[str] = Query(None),
     date: Optional[date] = Query(None),          # ← add this
+    page: PageParams = Depends(page_params),
+    fields: Optional[List[str]] = Depends(field_params),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    q = db.query(Order)
+    stmt = select(Order)
     if status:
-        q = q.filter(Order.status == status)
+        stmt = stmt.where(Order.status == status)
     if date:
-        q = (
-            q.join(Order.attendee)
-             .join(ReservationAttendee.reservation)
-             .filter(Reservation.date == date)
+        stmt = (
+            stmt.join(Order.attendee)
+                .join(ReservationAttendee.reservation)
+                .where(Reservation.date == date)
+        )
+
+    def load():
+        source = Response()
+        result = paginate(
+            db, stmt, order_by=[Order.id], descending=True,
+            page=page, response=source, fields=fields, schema=OrderResponse,
         )
-    return q.order_by(Order.id.desc()).all()
+        if isinstance(result, Response):   # field projection
+            body, source = result.body, result
+        else:
+            body = _order_list.dump_json(_order_list.validate_python(result, from_attributes=True))
+        headers = {
+            name: source.headers[name]
+            for name in (NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER)
+            if name in source.headers
+        }
+        return body, headers
+
+    # Kitchen screens poll this in bursts; identical requests share one query
+    body, headers = single_flight.do(request_key(request, "staff"), load, db)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.patch("/orders/{order_id}/fulfill", response_model=OrderResponse)
 def admin_fulfill_order(
     order_id: int,
+    response: Response,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
@@ -659,8 +809,9 @@ def admin_fulfill_order(
     if order.status != "fired":
         raise HTTPException(status_code=400, detail="Order must be fired before fulfilling")
     order.status = "fulfilled"
-    db.commit()
+    commit_versioned(db)
     db.refresh(order)
+    set_etag(response, order.version)
     return order
 
 
@@ -678,20 +829,428 @@ def admin_delete_order(
     return None
 
 
+# ══════════════════════════════════════════════
+# PREP SHEET (kitchen)
+# ══════════════════════════════════════════════
+
+# Reservations carry no meal field; a service is the start_time window [from, to).
+MEAL_WINDOWS = {
+    "breakfast": (time(0, 0), time(11, 0)),
+    "lunch":     (time(11, 0), time(16, 0)),
+    "dinner":    (time(16, 0), None),
+}
+
+
+def _in_meal_window(stmt, meal: Optional[str]):
+    if meal:
+        start, end = MEAL_WINDOWS[meal]
+        stmt = stmt.where(Reservation.start_time >= start)
+        if end is not None:
+            stmt = stmt.where(Reservation.start_time < end)
+    return stmt
+
+
+@router.get("/prep-sheet")
+def admin_prep_sheet(
+    date: date = Query(...),
+    meal: Optional[Literal["breakfast", "lunch", "dinner"]] = Query(None),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    # Each attendee's restrictions are unnested so counts come out of the same
+    # GROUP BY. Quantity is only summed on the first unnested row (or the NULL
+    # row for attendees with none), so lines are never double counted.
+    diet = (
+        func.unnest(ReservationAttendee.dietary_restrictions)
+        .table_valued("restriction", with_ordinality="ord")
+        .render_derived(name="diet")
+        .lateral()
+    )
+    first_row = or_(diet.c.ord.is_(None), diet.c.ord == 1)
+
+    stmt = (
+        select(
+            OrderItem.menu_item_id,
+            MenuItem.name,
+            MenuItem.category,
+            Order.status,
+            diet.c.restriction,
+            func.coalesce(func.sum(OrderItem.quantity).filter(first_row), 0).label("quantity"),
+            func.count(distinct(ReservationAttendee.id)).label("attendees"),
+        )
+        .select_from(OrderItem)
+        .join(Order, Order.id == OrderItem.order_id)
+        .join(ReservationAttendee, ReservationAttendee.id == Order.attendee_id)
+        .join(Reservation, Reservation.id == ReservationAttendee.reservation_id)
+        .join(MenuItem, MenuItem.id == OrderItem.menu_item_id)
+        .outerjoin(diet, true())
+        .where(
+            Reservation.date == date,
+            Reservation.status != "cancelled",
+            OrderItem.status != "canceled",
+        )
+        .group_by(
+            OrderItem.menu_item_id,
+            MenuItem.name,
+            MenuItem.category,
+            Order.status,
+            diet.c.restriction,
+        )
+    )
+    stmt = _in_meal_window(stmt, meal)
+
+    items: dict[int, dict] = {}
+    categories: dict[Optional[str], dict] = {}
+    for menu_item_id, name, category, order_status, restriction, quantity, attendees in db.execute(stmt):
+        item = items.setdefault(menu_item_id, {
+            "menu_item_id": menu_item_id,
+            "name": name,
+            "category": category,
+            "total_quantity": 0,
+            "by_status": {},
+            "dietary_counts": {},
+        })
+        cat = categories.setdefault(category, {
+            "category": category,
+            "total_quantity": 0,
+            "by_status": {},
+        })
+        if quantity:
+            item["total_quantity"] += quantity
+            item["by_status"][order_status] = item["by_status"].get(order_status, 0) + quantity
+            cat["total_quantity"] += quantity
+            cat["by_status"][order_status] = cat["by_status"].get(order_status, 0) + quantity
+        if restriction:
+            item["dietary_counts"][restriction] = item["dietary_counts"].get(restriction, 0) + attendees
+
+    return {
+        "date": date,
+        "meal": meal,
+        "items": sorted(items.values(), key=lambda i: ((i["category"] or ""), i["name"])),
+        "categories": sorted(categories.values(), key=lambda c: c["category"] or ""),
+    }
+
+
+@router.get("/allergen-check")
+def admin_allergen_check(
+    date: date = Query(...),
+    meal: Optional[Literal["breakfast", "lunch", "dinner"]] = Query(None),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    # One pass over the service: attendee needs & ~item accommodates, computed
+    # per line in SQL on the precomputed masks. Only conflicting lines come back.
+    conflicts = ReservationAttendee.dietary_mask.bitwise_and(MenuItem.dietary_mask.bitwise_not())
+    stmt = (
+        select(
+            OrderItem.id,
+            OrderItem.order_id,
+            OrderItem.status,
+            ReservationAttendee.id,
+            func.coalesce(Member.name, ReservationAttendee.guest_name, "Guest"),
+            Reservation.id,
+            Reservation.start_time,
+            MenuItem.id,
+            MenuItem.name,
+            conflicts.label("conflicts"),
+        )
+        .select_from(OrderItem)
+        .join(Order, Order.id == OrderItem.order_id)
+        .join(ReservationAttendee, ReservationAttendee.id == Order.attendee_id)
+        .outerjoin(Member, Member.id == ReservationAttendee.member_id)
+        .join(Reservation, Reservation.id == ReservationAttendee.reservation_id)
+        .join(MenuItem, MenuItem.id == OrderItem.menu_item_id)
+        .where(
+            Reservation.date == date,
+            Reservation.status != "cancelled",
+            OrderItem.status != "canceled",
+            ReservationAttendee.dietary_mask != 0,
+            conflicts != 0,
+        )
+        .order_by(Reservation.start_time, Reservation.id, ReservationAttendee.id, OrderItem.id)
+    )
+    stmt = _in_meal_window(stmt, meal)
+
+    rows = [
+        {
+            "order_item_id": item_id,
+            "order_id": order_id,
+            "item_status": item_status,
+            "attendee_id": attendee_id,
+            "attendee_name": attendee_name,
+            "reservation_id": reservation_id,
+            "start_time": start_time,
+            "menu_item_id": menu_item_id,
+            "menu_item_name": menu_item_name,
+            "conflicts": from_mask(mask),
+        }
+        for (item_id, order_id, item_status, attendee_id, attendee_name,
+             reservation_id, start_time, menu_item_id, menu_item_name, mask) in db.execute(stmt)
+    ]
+    return {"date": date, "meal": meal, "conflict_count": len(rows), "conflicts": rows}
+
+
+# ══════════════════════════════════════════════
+# SEARCH (front desk)
+# ══════════════════════════════════════════════
+
+SEARCH_MAX_RESULTS = 50
+
+
+def _trgm_match(expr, q: str):
+    """
+    (predicate, score) for a lowercased q against lower(expr). Both the prefix
+    LIKE and the word-similarity operator (<%) are served by the pg_trgm GIN
+    index on lower(expr); prefix hits rank above fuzzy ones.
+    """
+    lowered = func.lower(expr)
+    prefix = lowered.startswith(q, autoescape=True)
+    predicate = or_(prefix, literal(q).bool_op("<%")(lowered))
+    score = case((prefix, 1.0), else_=func.word_similarity(q, lowered))
+    return predicate, score
+
+
+@router.get("/search/people")
+def admin_search_people(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(10, ge=1, le=SEARCH_MAX_RESULTS),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    q = q.strip().lower()
+    if len(q) < 2:
+        raise HTTPException(status_code=422, detail="q must be at least 2 characters")
+
+    member_match, member_score = _trgm_match(Member.name, q)
+    members = (
+        select(
+            literal("member").label("kind"),
+            Member.id.label("id"),
+            Member.name.label("name"),
+            User.email.label("email"),
+            select(func.count(distinct(ReservationAttendee.reservation_id)))
+            .where(ReservationAttendee.member_id == Member.id)
+            .scalar_subquery()
+            .label("reservation_count"),
+            member_score.label("score"),
+        )
+        .join(User, User.id == Member.user_id)
+        .where(member_match)
+    )
+
+    # Guests have no identity beyond the name; rows with the same name are one result
+    guest_match, guest_score = _trgm_match(ReservationAttendee.guest_name, q)
+    guests = (
+        select(
+            literal("guest").label("kind"),
+            func.min(ReservationAttendee.id).label("id"),
+            ReservationAttendee.guest_name.label("name"),
+            null().label("email"),
+            func.count(distinct(ReservationAttendee.reservation_id)).label("reservation_count"),
+            func.max(guest_score).label("score"),
+        )
+        .where(ReservationAttendee.member_id.is_(None), guest_match)
+        .group_by(ReservationAttendee.guest_name)
+    )
+
+    user_match, user_score = _trgm_match(User.email, q)
+    users = (
+        select(
+            literal("user").label("kind"),
+            User.id.label("id"),
+            null().label("name"),
+            User.email.label("email"),
+            select(func.count(Reservation.id))
+            .where(Reservation.user_id == User.id)
+            .scalar_subquery()
+            .label("reservation_count"),
+            user_score.label("score"),
+        )
+        .where(user_match)
+    )
+
+    people = union_all(members, guests, users).subquery("people")
+    stmt = (
+        select(people)
+        .order_by(people.c.score.desc(), func.coalesce(people.c.name, people.c.email))
+        .limit(limit)
+    )
+    return [
+        {
+            "kind": kind,
+            "id": row_id,
+            "name": name,
+            "email": email,
+            "reservation_count": reservation_count,
+            "score": round(float(score), 3),
+        }
+        for kind, row_id, name, email, reservation_count, score in db.execute(stmt)
+    ]
+
+
+RESERVATION_SEARCH_MAX = 100
+CODE_PREFIX_RANK = 10.0  # code hits outrank any text match
+
+
+@router.get("/search/reservations")
+def admin_search_reservations(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=RESERVATION_SEARCH_MAX),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    # Three index-backed matchers, unioned and summed per reservation:
+    #   code   reservation_code LIKE 'PREFIX%'       (text_pattern_ops btree)
+    #   notes  fts_vector(notes)      @@ prefix query (GIN)
+    #   guest  fts_vector(guest_name) @@ prefix query (GIN, via attendees)
+    code_prefix = re.sub(r"[^A-Z0-9-]", "", q.split()[0].upper()) if q.split() else ""
+    if code_prefix[:1].isdigit():
+        code_prefix = f"ABY-{code_prefix}"   # "20260224-18" → "ABY-20260224-18"
+    terms = re.findall(r"\w+", q.lower())
+
+    branches = []
+    if len(code_prefix) >= 3:
+        branches.append(
+            select(
+                Reservation.id.label("reservation_id"),
+                literal("code").label("matched"),
+                literal(CODE_PREFIX_RANK).label("rank"),
+            ).where(Reservation.reservation_code.like(f"{code_prefix}%"))
+        )
+    if terms:
+        tsquery = func.to_tsquery(text("'simple'::regconfig"), " & ".join(f"{t}:*" for t in terms))
+        notes_vec = fts_vector(Reservation.notes)
+        guest_vec = fts_vector(ReservationAttendee.guest_name)
+        branches.append(
+            select(
+                Reservation.id.label("reservation_id"),
+                literal("notes").label("matched"),
+                func.ts_rank(notes_vec, tsquery).label("rank"),
+            ).where(notes_vec.bool_op("@@")(tsquery))
+        )
+        branches.append(
+            select(
+                ReservationAttendee.reservation_id.label("reservation_id"),
+                literal("guest").label("matched"),
+                func.ts_rank(guest_vec, tsquery).label("rank"),
+            ).where(guest_vec.bool_op("@@")(tsquery))
+        )
+    if not branches:
+        raise HTTPException(status_code=422, detail="q has nothing searchable")
+
+    hits = union_all(*branches).subquery("hits")
+    scored = (
+        select(
+            hits.c.reservation_id,
+            func.sum(hits.c.rank).label("rank"),
+            func.array_agg(distinct(hits.c.matched)).label("matched"),
+        )
+        .group_by(hits.c.reservation_id)
+        .subquery("scored")
+    )
+    attendee_names = (
+        select(func.array_agg(func.coalesce(Member.name, ReservationAttendee.guest_name)))
+        .select_from(ReservationAttendee)
+        .outerjoin(Member, Member.id == ReservationAttendee.member_id)
+        .where(ReservationAttendee.reservation_id == Reservation.id)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(
+            Reservation.id,
+            Reservation.reservation_code,
+            Reservation.date,
+            Reservation.start_time,
+            Reservation.status,
+            Reservation.notes,
+            attendee_names.label("attendees"),
+            scored.c.matched,
+            scored.c.rank,
+        )
+        .join(scored, scored.c.reservation_id == Reservation.id)
+        .order_by(scored.c.rank.desc(), Reservation.date.desc(), Reservation.id.desc())
+        .offset(offset)
+        .limit(limit + 1)
+    )
+    rows = db.execute(stmt).all()
+    return {
+        "q": q,
+        "offset": offset,
+        "limit": limit,
+        "has_more": len(rows) > limit,
+        "results": [
+            {
+                "id": row.id,
+                "reservation_code": row.reservation_code,
+                "date": row.date,
+                "start_time": row.start_time,
+                "status": row.status,
+                "notes": row.notes,
+                "attendees": [n for n in (row.attendees or []) if n],
+                "matched": sorted(row.matched),
+                "rank": round(float(row.rank), 4),
+            }
+            for row in rows[:limit]
+        ],
+    }
+
 # ══════════════════════════════════════════════
 # MESSAGES
 # ══════════════════════════════════════════════
 
 @router.get("/messages")
 def admin_list_messages(
+    response: Response,
     reservation_id: Optional[int] = Query(None),
+    page: PageParams = Depends(page_params),
+    fields: Optional[List[str]] = Depends(field_params),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    q = db.query(Message).options(selectinload(Message.sender))
+    stmt = select(Message)
+    # Newest first. Within a thread: (created_at, id) on the composite index;
+    # across all threads: id (the primary key), which follows insertion order.
+    order_by = [Message.id]
     if reservation_id:
-        q = q.filter(Message.reservation_id == reservation_id)
-    return q.order_by(Message.created_at.desc()).all()
+        stmt = stmt.where(Message.reservation_id == reservation_id)
+        order_by = [Message.created_at, Message.id]
+    return paginate(
+        db, stmt, order_by=order_by, descending=True,
+        page=page, response=response, fields=fields,
+        options=[selectinload(Message.sender)],
+    )
+
+
+@router.post("/messages/broadcast", status_code=201)
+def admin_broadcast_message(
+    payload: MessageBroadcast,
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    # One INSERT ... SELECT over the matching reservations
+    targets = select(
+        Reservation.id, literal(admin.id), literal(payload.body), func.now(),
+    ).where(
+        Reservation.date == payload.date,
+        Reservation.status.in_(payload.statuses),
+    )
+    if payload.dining_room_id is not None:
+        targets = targets.where(Reservation.dining_room_id == payload.dining_room_id)
+    targets = _in_meal_window(targets, payload.meal)
+
+    reservation_ids = db.execute(
+        insert(Message)
+        .from_select(["reservation_id", "sender_user_id", "body", "created_at"], targets)
+        .returning(Message.reservation_id)
+    ).scalars().all()
+    db.commit()
+
+    if reservation_ids:
+        message_bus.publish(
+            date_topic(payload.date), *(reservation_topic(rid) for rid in reservation_ids)
+        )
+    return {"date": payload.date, "sent": len(reservation_ids), "reservation_ids": reservation_ids}
 
 
 @router.delete("/messages/{message_id}", status_code=204)
@@ -714,17 +1273,24 @@ def admin_delete_message(
 
 @router.get("/seat-assignments")
 def admin_list_seat_assignments(
+    response: Response,
     date: Optional[date] = Query(None),
+    page: PageParams = Depends(page_params),
+    fields: Optional[List[str]] = Depends(field_params),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    q = db.query(SeatAssignment).options(
-        selectinload(SeatAssignment.reservation),
-        selectinload(SeatAssignment.table),
-    )
+    stmt = select(SeatAssignment)
     if date:
-        q = q.join(Reservation).filter(Reservation.date == date)
-    return q.order_by(SeatAssignment.id.asc()).all()
+        stmt = stmt.join(Reservation).where(Reservation.date == date)
+    return paginate(
+        db, stmt, order_by=[SeatAssignment.id],
+        page=page, response=response, fields=fields,
+        options=[
+            selectinload(SeatAssignment.reservation),
+            selectinload(SeatAssignment.table),
+        ],
+    )
 
 
 @router.delete("/seat-assignments/{assignment_id}", status_code=204)
@@ -746,101 +1312,136 @@ def admin_delete_seat_assignment(
 
 @router.get("/daily")
 def admin_daily_view(
+    request: Request,
     date: date = Query(...),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    reservations = (
-        db.query(Reservation)
-        .options(
-            selectinload(Reservation.attendees)
-                .selectinload(ReservationAttendee.member),
-            selectinload(Reservation.attendees)
-                .selectinload(ReservationAttendee.order)
-                .selectinload(Order.items),
-            selectinload(Reservation.seat_assignment)
-                .selectinload(SeatAssignment.table),
-            selectinload(Reservation.messages),
-            selectinload(Reservation.dining_room),
-        )
-        .filter(Reservation.date == date)
-        .order_by(Reservation.start_time.asc())
-        .all()
+    # Built as one JSON document by Postgres (services.daily_board) and cached
+    # until a write touches this date (services.board_cache); concurrent
+    # misses share one build. Tablets polling with If-None-Match get a 304
+    # until it changes.
+    user_id = admin.id
+    body, etag = single_flight.do(
+        request_key(request, user_id), lambda: board_cache.get(db, date, user_id), db
     )
+    return json_bytes_response(request, body, etag)
 
-    result = []
-    for r in reservations:
-        table_info = None
-        if r.seat_assignment:
-            t = r.seat_assignment.table
-            table_info = {
-                "table_id": t.id,
-                "table_name": t.name,
-                "seat_count": t.seat_count,
-            }
 
-        primary = next(
-            (a for a in r.attendees if a.member and a.member.relation == "Primary"),
-            r.attendees[0] if r.attendees else None,
+# ══════════════════════════════════════════════
+# BOARD (multi-day planning)
+# ══════════════════════════════════════════════
+
+BOARD_MAX_DAYS = 31
+
+
+@router.get("/board")
+def admin_board(
+    request: Request,
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    detail: Optional[date] = Query(None, description="Also embed the full daily board for this date"),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    """
+    Per-day summaries for a date range: covers, reservations per room,
+    seated vs unseated and order states. Cancelled reservations only
+    appear in by_status. Two grouped queries, whatever the range holds.
+    """
+    if date_to < date_from:
+        raise HTTPException(status_code=422, detail="'to' must not be before 'from'")
+    span = (date_to - date_from).days + 1
+    if span > BOARD_MAX_DAYS:
+        raise HTTPException(status_code=422, detail=f"At most {BOARD_MAX_DAYS} days per request")
+    if detail is not None and not date_from <= detail <= date_to:
+        raise HTTPException(status_code=422, detail="'detail' must fall within the range")
+
+    in_range = Reservation.date.between(date_from, date_to)
+    party = (
+        select(ReservationAttendee.reservation_id, func.count().label("party_size"))
+        .where(ReservationAttendee.reservation_id.in_(select(Reservation.id).where(in_range)))
+        .group_by(ReservationAttendee.reservation_id)
+        .subquery("party")
+    )
+    reservation_rows = db.execute(
+        select(
+            Reservation.date,
+            Reservation.status,
+            Reservation.dining_room_id,
+            DiningRoom.name.label("room_name"),
+            func.count().label("reservations"),
+            func.count(SeatAssignment.id).label("seated"),
+            func.coalesce(func.sum(party.c.party_size), 0).label("covers"),
         )
-        primary_name = None
-        if primary:
-            primary_name = primary.member.name if primary.member else primary.guest_name
-
-        # Build orders summary for card chips
-        orders = [a.order for a in r.attendees if a.order]
-        orders_data = []
-        for o in orders:
-            orders_data.append({
-                "id": o.id,
-                "status": o.status,
-                "item_count": len(o.items),
-                "items": [
-                    {
-                        "id": i.id,
-                        "name_snapshot": i.name_snapshot,
-                        "price_cents_snapshot": i.price_cents_snapshot,
-                        "quantity": i.quantity,
-                        "status": i.status,
-                    }
-                    for i in o.items
-                ],
-            })
-
-        # Full attendees for party names on cards
-        attendees_data = [
-            {
-                "id": a.id,
-                "member_id": a.member_id,
-                "guest_name": a.guest_name,
-                "member": {"name": a.member.name} if a.member else None,
-                "dietary_restrictions": a.dietary_restrictions or [],
-            }
-            for a in r.attendees
-        ]
-
-        # Unread message count
-        unread_count = len(r.messages) if r.messages else 0
-
-        result.append({
-            "reservation_id": r.id,
-            "user_id": r.user_id,
-            "date": r.date,
-            "start_time": r.start_time,
-            "end_time": r.end_time,
-            "status": r.status,
-            "notes": r.notes,
-            "meal_type": getattr(r, "meal_type", None),
-            "dining_room_id": r.dining_room_id,
-            "dining_room": {"name": r.dining_room.name} if r.dining_room else None,
-            "dining_room_name": r.dining_room.name if r.dining_room else None,
-            "primary_member": primary_name,
-            "party_size": len(r.attendees),
-            "table": table_info,
-            "message_count": len(r.messages),
-            "unread_message_count": unread_count,
-            "attendees": attendees_data,
-            "orders": orders_data,
+        .select_from(Reservation)
+        .outerjoin(DiningRoom, DiningRoom.id == Reservation.dining_room_id)
+        .outerjoin(SeatAssignment, SeatAssignment.reservation_id == Reservation.id)
+        .outerjoin(party, party.c.reservation_id == Reservation.id)
+        .where(in_range)
+        .group_by(Reservation.date, Reservation.status, Reservation.dining_room_id, DiningRoom.name)
+    ).all()
+
+    order_rows = db.execute(
+        select(Reservation.date, Order.status, func.count().label("orders"))
+        .select_from(Order)
+        .join(ReservationAttendee, ReservationAttendee.id == Order.attendee_id)
+        .join(Reservation, Reservation.id == ReservationAttendee.reservation_id)
+        .where(in_range, Reservation.status != "cancelled")
+        .group_by(Reservation.date, Order.status)
+    ).all()
+
+    days = {}
+    rooms = {}
+    for offset in range(span):
+        day = date_from + timedelta(days=offset)
+        days[day] = {
+            "date": day.isoformat(),
+            "reservations": 0,
+            "covers": 0,
+            "seated": 0,
+            "unseated": 0,
+            "by_status": {},
+            "rooms": [],
+            "orders": {},
+        }
+        rooms[day] = {}
+
+    for row in reservation_rows:
+        summary = days[row.date]
+        summary["by_status"][row.status] = summary["by_status"].get(row.status, 0) + row.reservations
+        if row.status == "cancelled":
+            continue
+        covers = int(row.covers)   # sum() of a count comes back as numeric
+        summary["reservations"] += row.reservations
+        summary["covers"] += covers
+        summary["seated"] += row.seated
+        summary["unseated"] += row.reservations - row.seated
+        room = rooms[row.date].setdefault(row.dining_room_id, {
+            "dining_room_id": row.dining_room_id,
+            "dining_room_name": row.room_name,
+            "reservations": 0,
+            "covers": 0,
         })
+        room["reservations"] += row.reservations
+        room["covers"] += covers
+
+    for row in order_rows:
+        days[row.date]["orders"][row.status] = row.orders
+
+    for day, summary in days.items():
+        summary["rooms"] = sorted(
+            rooms[day].values(),
+            key=lambda r: (r["dining_room_name"] is None, (r["dining_room_name"] or "").lower()),
+        )
 
-    return {"date": date, "reservations": result, "total": len(result)}
\ No newline at end of file
+    body = json.dumps(
+        {"from": date_from.isoformat(), "to": date_to.isoformat(), "days": list(days.values())},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    if detail is not None:
+        # The day's full board straight from the daily-board cache, spliced
+        # in as bytes rather than decoded and re-encoded
+        board, _ = board_cache.get(db, detail, admin.id)
+        body = body[:-1] + b',"detail":' + board + b"}"
+    return json_bytes_response(request, body, etag_for_bytes(body))
@@ -1,20 +1,17 @@
 # app/api/routes/health.py
 from __future__ import annotations
 
-import time
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.api.deps.db import get_db
 from app.core.config import get_settings
-
-# Reuse your existing auth dependency (optional token)
-from app.api.deps.auth import get_current_user_optional
+from app.services.health_probe import STALE_AFTER_SECONDS, health_prober, pool_stats
 
 settings = get_settings()
 
@@ -25,75 +22,70 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@router.get("/live")
+async def live():
+    # Process is up and serving; touches nothing else. async (like /ready)
+    # so it runs on the event loop even when every threadpool worker is busy.
+    return {"status": "ok"}
+
+
 @router.get("")
-def health(
-    request: Request,
-    db: Session = Depends(get_db),
-    user = Depends(get_current_user_optional),
-):
-    started = time.perf_counter()
-
-    db_ok = True
-    db_error: Optional[str] = None
-    db_latency_ms: Optional[int] = None
-
-    # Database ping (cheap + reliable)
-    try:
-        t0 = time.perf_counter()
-        db.execute(text("SELECT 1"))
-        db_latency_ms = int((time.perf_counter() - t0) * 1000)
-    except Exception as e:  # pragma: no cover (varies by driver/env)
-        db_ok = False
-        db_error = str(e)
-
-    elapsed_ms = int((time.perf_counter() - started) * 1000)
-
-     # Optional auth check:
-    # - If Authorization: Bearer <token> is present, we validate it and report ok/fail.
-    # - If no token is present, we report skipped (endpoint stays monitoring-friendly).
-    auth_header = request.headers.get("authorization") or ""
-    has_bearer = auth_header.lower().startswith("bearer ")
-
-    if not has_bearer:
-        auth_check = {
-            "status": "skipped",
-            "note": "No bearer token provided.",
-        }
-    elif user is None:
-        auth_check = {
-            "status": "fail",
-            "note": "Bearer token provided but invalid/expired.",
+@router.get("/ready")
+async def ready():
+    """
+    Readiness from the background prober (services.health_probe): the last
+    database check and migration head vs this build. 503 only when one of
+    those fails; a saturated pool is reported as "degraded" with 200, since
+    taking the instance out of rotation would only move its load elsewhere.
+    Never checks out a connection or decodes a token.
+    """
+    latest = health_prober.latest
+    age = health_prober.age_seconds()
+    pool = pool_stats()
+
+    if latest is None:
+        database = {"status": "fail", "error": "No probe has completed yet."}
+    else:
+        database = {
+            "status": "ok" if latest.database_ok else "fail",
+            "latency_ms": latest.latency_ms,
+            "error": latest.error,
+            "checked_at_utc": latest.checked_at_utc,
+            "age_s": round(age, 1),
         }
+        if latest.database_ok and age > STALE_AFTER_SECONDS:
+            database["status"] = "stale"
+
+    expected = health_prober.expected_heads
+    current = latest.current_heads if latest else None
+    if expected is None:
+        migrations = {"status": "fail", "error": health_prober.heads_error}
     else:
-        auth_check = {
-            "status": "ok",
-            "note": "Bearer token validated.",
-            "user_id": getattr(user, "id", None),
-            "role": getattr(user, "role", None),
+        migrations = {
+            "status": "ok" if current == expected else "fail",
+            "current": current,
+            "expected": expected,
         }
 
+    is_ready = database["status"] == "ok" and migrations["status"] == "ok"
     payload: Dict[str, Any] = {
-        "status": "ok" if db_ok else "degraded",
+        "status": "ok" if is_ready and pool["status"] == "ok" else "degraded",
         "service": "aaa-backend",
         "env": settings.ENV,
         "time_utc": utc_now_iso(),
-        "latency_ms": elapsed_ms,
         "checks": {
             "server": {"status": "ok"},
-            "database": {
-                "status": "ok" if db_ok else "fail",
-                "latency_ms": db_latency_ms,
-                "error": db_error,
-            },
-            "auth": auth_check,
+            "database": database,
+            "migrations": migrations,
+            "pool": pool,
         },
     }
+    return JSONResponse(payload, status_code=200 if is_ready else 503)
 
-    status_code = 200 if db_ok else 503
-    return JSONResponse(payload, status_code=status_code)
 
 @router.get("/debug/alembic")
 def debug_alembic(db: Session = Depends(get_db)):
+    # Diagnostic only: queries the catalog on demand. Probes use /live and /ready.
     # 1) Alembic version table (may not exist)
     try:
         current = db.execute(text("SELECT version_num FROM alembic_version")).fetchall()
@@ -117,4 +109,8 @@ def debug_alembic(db: Session = Depends(get_db)):
     except Exception as e:
         tables = {"error": str(e)}
 
-    return {"alembic_version": current, "tables": tables}
\ No newline at end of file
+    return {
+        "alembic_version": current,
+        "expected_heads": health_prober.expected_heads,
+        "tables": tables,
+    }
\ No newline at end of file
@@ -0,0 +1,256 @@
+# app/api/routes/kitchen.py
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import case, extract, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.api.deps.auth import get_current_user
+from app.api.deps.db import get_db
+from app.models.menu_item import MenuItem
+from app.models.order import Order
+from app.models.order_item import OrderItem
+from app.models.reservation import Reservation
+from app.models.reservation_attendee import ReservationAttendee
+from app.models.user import User
+from app.schemas.order_items import OrderItemResponse
+
+router = APIRouter(prefix="/kitchen", tags=["kitchen"])
+
+# Station routing is driven by MenuItem.category (compared lowercase).
+# Anything uncategorized or not listed here lands on DEFAULT_STATION.
+STATION_CATEGORIES = {
+    "grill":  ("grill", "entree", "entrees", "mains", "steaks"),
+    "cold":   ("cold", "appetizers", "salads", "raw bar", "starters"),
+    "pastry": ("pastry", "desserts", "bread", "bakery"),
+}
+DEFAULT_STATION = "line"
+STATIONS = (*STATION_CATEGORIES, DEFAULT_STATION)
+
+
+def _require_staff(user: User) -> None:
+    if getattr(user, "role", None) not in ("staff", "admin"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Staff only")
+
+
+def _require_station(station: str) -> str:
+    station = station.lower()
+    if station not in STATIONS:
+        raise HTTPException(status_code=404, detail=f"Unknown station: {station}")
+    return station
+
+
+def station_filter(station: str):
+    """SQL predicate on MenuItem.category selecting the items routed to `station`."""
+    category = func.lower(MenuItem.category)
+    if station == DEFAULT_STATION:
+        mapped = [c for cats in STATION_CATEGORIES.values() for c in cats]
+        return or_(MenuItem.category.is_(None), category.not_in(mapped))
+    return category.in_(STATION_CATEGORIES[station])
+
+
+def station_expr():
+    """SQL CASE mapping MenuItem.category to its station name."""
+    category = func.lower(MenuItem.category)
+    return case(
+        *((category.in_(cats), station) for station, cats in STATION_CATEGORIES.items()),
+        else_=DEFAULT_STATION,
+    )
+
+
+@router.get("/stations")
+def list_stations(
+    current_user: User = Depends(get_current_user),
+):
+    _require_staff(current_user)
+    return [
+        {"station": s, "categories": list(STATION_CATEGORIES.get(s, ()))}
+        for s in STATIONS
+    ]
+
+
+@router.get("/stations/{station}/queue", response_model=List[OrderItemResponse])
+def station_queue(
+    station: str,
+    date: Optional[date] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Confirmed + preparing tickets for one station, oldest fired order first."""
+    _require_staff(current_user)
+    station = _require_station(station)
+
+    stmt = (
+        select(OrderItem)
+        .join(Order, Order.id == OrderItem.order_id)
+        .join(MenuItem, MenuItem.id == OrderItem.menu_item_id)
+        .where(
+            Order.status == "fired",
+            OrderItem.status.in_(("confirmed", "preparing")),
+            station_filter(station),
+        )
+        .order_by(Order.fired_at.asc().nulls_last(), OrderItem.id.asc())
+    )
+    if date:
+        stmt = (
+            stmt.join(ReservationAttendee, ReservationAttendee.id == Order.attendee_id)
+            .join(Reservation, Reservation.id == ReservationAttendee.reservation_id)
+            .where(Reservation.date == date)
+        )
+    return db.execute(stmt).scalars().all()
+
+
+@router.post("/stations/{station}/claim", response_model=OrderItemResponse)
+def claim_next_ticket(
+    station: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Move the next confirmed item for this station to "preparing".
+
+    FOR UPDATE SKIP LOCKED lets several station screens claim at once: a row
+    another cook is claiming is skipped instead of waited on.
+    """
+    _require_staff(current_user)
+    station = _require_station(station)
+
+    item = db.execute(
+        select(OrderItem)
+        .join(Order, Order.id == OrderItem.order_id)
+        .join(MenuItem, MenuItem.id == OrderItem.menu_item_id)
+        .where(
+            Order.status == "fired",
+            OrderItem.status == "confirmed",
+            station_filter(station),
+        )
+        .order_by(Order.fired_at.asc().nulls_last(), OrderItem.id.asc())
+        .limit(1)
+        .with_for_update(of=OrderItem, skip_locked=True)
+    ).scalar_one_or_none()
+
+    if not item:
+        raise HTTPException(status_code=404, detail="No tickets waiting")
+
+    item.status = "preparing"
+    db.commit()
+    db.refresh(item)
+    return item
+
+
+@router.post("/items/{order_item_id}/serve", response_model=OrderItemResponse)
+def serve_item(
+    order_item_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    _require_staff(current_user)
+
+    item = db.get(OrderItem, order_item_id)
+    if not item:
+        raise HTTPException(status_code=404, detail="Order item not found")
+    if item.status != "preparing":
+        raise HTTPException(status_code=409, detail="Item must be preparing before it is served")
+
+    item.status = "served"
+    db.commit()
+    db.refresh(item)
+    return item
+
+
+# ── METRICS ───────────────────────────────────────────────
+
+def _percentiles(seconds):
+    return (
+        func.count().label("tickets"),
+        func.percentile_cont(0.5).within_group(seconds).label("p50"),
+        func.percentile_cont(0.9).within_group(seconds).label("p90"),
+        func.percentile_cont(0.99).within_group(seconds).label("p99"),
+    )
+
+
+def _rows(db: Session, stmt, *keys: str) -> list[dict]:
+    # `keys` name the leading (group-by) columns of `stmt`
+    return [
+        {
+            **dict(zip(keys, row)),
+            "count": row.tickets,
+            "p50_seconds": row.p50,
+            "p90_seconds": row.p90,
+            "p99_seconds": row.p99,
+        }
+        for row in db.execute(stmt)
+    ]
+
+
+@router.get("/metrics")
+def kitchen_metrics(
+    from_date: date = Query(..., alias="from"),
+    to_date: date = Query(..., alias="to"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Ticket-time percentiles (seconds) for orders fired in [from, to], UTC days.
+
+    - by_station / by_menu_item: order fired_at → item served_at
+    - by_hour: order fired_at → fulfilled_at, bucketed by the hour it was fired
+    """
+    _require_staff(current_user)
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+
+    start = datetime.combine(from_date, time.min, tzinfo=timezone.utc)
+    end = datetime.combine(to_date + timedelta(days=1), time.min, tzinfo=timezone.utc)
+    fired_in_range = (Order.fired_at >= start, Order.fired_at < end)
+
+    # Computed keys (station CASE, hour) live in subqueries so the outer
+    # GROUP BY is on plain columns rather than repeated bound expressions.
+    item_times = (
+        select(
+            station_expr().label("station"),
+            MenuItem.id.label("menu_item_id"),
+            MenuItem.name.label("name"),
+            extract("epoch", OrderItem.served_at - Order.fired_at).label("seconds"),
+        )
+        .select_from(OrderItem)
+        .join(Order, Order.id == OrderItem.order_id)
+        .join(MenuItem, MenuItem.id == OrderItem.menu_item_id)
+        .where(*fired_in_range, OrderItem.served_at.is_not(None))
+        .subquery()
+    )
+    order_times = (
+        select(
+            extract("hour", func.timezone("UTC", Order.fired_at)).label("hour"),
+            extract("epoch", Order.fulfilled_at - Order.fired_at).label("seconds"),
+        )
+        .where(*fired_in_range, Order.fulfilled_at.is_not(None))
+        .subquery()
+    )
+
+    by_station = (
+        select(item_times.c.station, *_percentiles(item_times.c.seconds))
+        .group_by(item_times.c.station)
+        .order_by(item_times.c.station)
+    )
+    by_menu_item = (
+        select(item_times.c.menu_item_id, item_times.c.name, *_percentiles(item_times.c.seconds))
+        .group_by(item_times.c.menu_item_id, item_times.c.name)
+        .order_by(item_times.c.name)
+    )
+    by_hour = (
+        select(order_times.c.hour, *_percentiles(order_times.c.seconds))
+        .group_by(order_times.c.hour)
+        .order_by(order_times.c.hour)
+    )
+
+    return {
+        "from": from_date,
+        "to": to_date,
+        "by_station": _rows(db, by_station, "station"),
+        "by_hour": [{**r, "hour": int(r["hour"])} for r in _rows(db, by_hour, "hour")],
+        "by_menu_item": _rows(db, by_menu_item, "menu_item_id", "name"),
+    }
@@ -10,6 +10,7 @@ from app.api.deps.auth import get_current_user
 from app.models.member import Member
 from app.models.user import User
 from app.schemas.member import MemberCreate, MemberRead, MemberUpdate
+from app.services import bulk
 
 router = APIRouter(prefix="/members", tags=["members"])
 
@@ -100,27 +101,16 @@ def delete_member(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    member = db.get(Member, member_id)
-    if not member:
+    owner_id = db.execute(
+        select(Member.user_id).where(Member.id == member_id)
+    ).scalar_one_or_none()
+    if owner_id is None:
         raise HTTPException(status_code=404, detail="Member not found")
 
-    if member.user_id != current_user.id and current_user.role != "admin":
+    if owner_id != current_user.id and current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    from app.models.reservation_attendee import ReservationAttendee
-
-    # Detach attendee rows that reference this member.
-    # Must set guest_name too — the check constraint requires
-    # member_id OR guest_name to be non-null, never both null.
-    attendees = db.query(ReservationAttendee)\
-        .filter(ReservationAttendee.member_id == member_id)\
-        .all()
-
-    for att in attendees:
-        att.guest_name = member.name  # preserve the name as a guest record
-        att.member_id = None
-
-    db.flush()  # apply the attendee updates before deleting the member
-    db.delete(member)
+    # Attendee rows keep the name as a guest record; one UPDATE ... FROM + DELETE
+    bulk.delete_member(db, member_id)
     db.commit()
     return None
@@ -0,0 +1,23 @@
+# app/api/routes/menu.py
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+
+from app.api.deps.db import get_db
+from app.core.http_cache import json_bytes_response
+from app.schemas.menu_item import MenuResponse
+from app.services.menu_catalog import menu_catalog
+
+router = APIRouter(prefix="/menu", tags=["menu"])
+
+
+@router.get("", response_model=MenuResponse)
+def get_menu(
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    # Public. Built once per menu version and served as cached bytes; clients
+    # send If-None-Match and get 304 until the menu changes.
+    body, etag = menu_catalog.grouped_json(db)
+    return json_bytes_response(request, body, etag)
@@ -3,18 +3,29 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_user, get_current_user_optional
 from app.api.deps.db import get_db
+from app.core.dietary import DIETARY_RESTRICTIONS
+from app.core.http_cache import json_bytes_response
 from app.models.menu_item import MenuItem
+from app.models.reservation import Reservation
+from app.models.reservation_attendee import ReservationAttendee
 from app.models.user import User
 from app.schemas.menu_item import MenuItemCreate, MenuItemResponse, MenuItemUpdate
+from app.services.menu_catalog import menu_catalog
+from app.services.single_flight import single_flight
 
 
 router = APIRouter(prefix="/menu-items", tags=["menu_items"])
 
+_menu_list = TypeAdapter(List[MenuItemResponse])
+
 
 def require_admin(user: User) -> None:
     if user.role != "admin":
@@ -24,18 +35,72 @@ def require_admin(user: User) -> None:
         )
 
 
+def _parse_compatible_with(raw: Optional[str]) -> List[str]:
+    if not raw:
+        return []
+    values = sorted({v.strip() for v in raw.split(",") if v.strip()})
+    unknown = [v for v in values if v not in DIETARY_RESTRICTIONS]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown dietary restrictions: {unknown}")
+    return values
+
+
+def _attendee_restrictions(db: Session, user: Optional[User], attendee_id: int) -> List[str]:
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    row = db.execute(
+        select(ReservationAttendee.dietary_restrictions, Reservation.user_id)
+        .join(Reservation, Reservation.id == ReservationAttendee.reservation_id)
+        .where(ReservationAttendee.id == attendee_id)
+    ).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Attendee not found")
+    restrictions, owner_id = row
+    if owner_id != user.id and user.role not in ("admin", "staff"):
+        raise HTTPException(status_code=403, detail="Not allowed")
+    return list(restrictions or [])
+
+
 @router.get("", response_model=List[MenuItemResponse])
 def list_menu_items(
+    request: Request,
     include_inactive: bool = Query(False, description="Include inactive items (admin only)"),
+    compatible_with: Optional[str] = Query(
+        None, description="Comma-separated accommodations every item must satisfy"
+    ),
+    attendee_id: Optional[int] = Query(
+        None, description="Only items compatible with this attendee's restrictions"
+    ),
     db: Session = Depends(get_db),
     user: Optional[User] = Depends(get_current_user_optional),  # public — no auth required
 ):
-    q = db.query(MenuItem)
-    # Only admins with include_inactive=true see inactive items
-    # Unauthenticated users, members, staff — active only
-    if not include_inactive or not user or user.role != "admin":
-        q = q.filter(MenuItem.is_active.is_(True))
-    return q.order_by(MenuItem.name.asc()).all()
+    required = set(_parse_compatible_with(compatible_with))
+    if attendee_id is not None:
+        required.update(_attendee_restrictions(db, user, attendee_id))
+    show_inactive = include_inactive and user and user.role == "admin"
+
+    if required or show_inactive:
+        stmt = select(MenuItem).order_by(MenuItem.name.asc())
+        if not show_inactive:
+            stmt = stmt.where(MenuItem.is_active.is_(True))
+        if required:
+            # JSONB containment (@>) — answered from the GIN index
+            stmt = stmt.where(MenuItem.dietary_restrictions.contains(sorted(required)))
+
+        # The result depends only on the filter, not on who asked (the
+        # attendee ownership check above already ran for this request)
+        body = single_flight.do(
+            ("menu-items", tuple(sorted(required)), show_inactive),
+            lambda: _menu_list.dump_json(_menu_list.validate_python(
+                db.execute(stmt).scalars().all(), from_attributes=True
+            )),
+            db,
+        )
+        return Response(content=body, media_type="application/json")
+
+    # Unauthenticated users, members, staff — active only, served from the catalog cache
+    body, etag = menu_catalog.active_json(db)
+    return json_bytes_response(request, body, etag)
 
 
 @router.post("", response_model=MenuItemResponse, status_code=status.HTTP_201_CREATED)
@@ -54,7 +119,12 @@ def create_menu_item(
         is_active=payload.is_active,
     )
     db.add(item)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="A menu item with that name already exists")
+    menu_catalog.invalidate()
     db.refresh(item)
     return item
 
@@ -76,6 +146,11 @@ def update_menu_item(
     for k, v in data.items():
         setattr(item, k, v)
 
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="A menu item with that name already exists")
+    menu_catalog.invalidate()
     db.refresh(item)
     return item
\ No newline at end of file
@@ -1,18 +1,35 @@
 # app/api/routes/messages.py
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
 
 from app.api.deps.db import get_db
+from app.api.deps.pagination import DEFAULT_LIMIT, PageParams, page_params, paginate
 from app.models.message import Message
+from app.models.message_read_cursor import MessageReadCursor, advance_read_cursor, message_counts
 from app.models.reservation import Reservation
-from app.schemas.messages import MessageCreate, MessageResponse
+from app.schemas.messages import (
+    MessageCreate,
+    MessageReadCursorResponse,
+    MessageReadUpdate,
+    MessageResponse,
+)
 from app.api.deps.auth import get_current_user
 from app.models.user import User
+from app.services.board_cache import board_cache
+from app.services.message_bus import date_topic, message_bus, reservation_topic
 
 router = APIRouter(prefix="/messages", tags=["messages"])
 
+STREAM_MAX_WAIT = 60
+STREAM_BATCH = 200
+
 
 # -----------------------------------------------------------
 # List messages for a reservation
@@ -20,6 +37,14 @@ router = APIRouter(prefix="/messages", tags=["messages"])
 @router.get("/by-reservation/{reservation_id}", response_model=list[MessageResponse])
 def list_messages(
     reservation_id: int,
+    response: Response,
+    latest: bool = Query(
+        False,
+        description="Page from the newest message back with the cursor "
+                    f"({DEFAULT_LIMIT} per page unless limit is given; "
+                    "each page is still returned oldest → newest)",
+    ),
+    page: PageParams = Depends(page_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -27,16 +52,71 @@ def list_messages(
     if not reservation:
         raise HTTPException(status_code=404, detail="Reservation not found")
 
-    messages = (
-        db.query(Message)
-        .filter(Message.reservation_id == reservation_id)
-        .order_by(Message.created_at.asc())
-        .all()
+    # The whole thread unless the client asks for pages (limit, cursor or
+    # latest). Keyset on (created_at, id) within the reservation — a range
+    # scan on ix_messages_reservation_id_created_at_id in either direction
+    if latest and page.limit is None:
+        page = page._replace(limit=DEFAULT_LIMIT)
+    messages = paginate(
+        db,
+        select(Message).where(Message.reservation_id == reservation_id),
+        order_by=[Message.created_at, Message.id],
+        descending=latest,
+        page=page,
+        response=response,
+        options=[selectinload(Message.sender)],
     )
-
+    if latest:
+        messages.reverse()
     return messages
 
 
+# -----------------------------------------------------------
+# Mark a thread read (up to a message, default: all of it)
+# -----------------------------------------------------------
+@router.post("/by-reservation/{reservation_id}/read", response_model=MessageReadCursorResponse)
+def mark_read(
+    reservation_id: int,
+    payload: Optional[MessageReadUpdate] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    row = db.execute(
+        select(Reservation.user_id, Reservation.date).where(Reservation.id == reservation_id)
+    ).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Reservation not found")
+    if row.user_id != current_user.id and current_user.role not in ("admin", "staff"):
+        raise HTTPException(status_code=403, detail="Not allowed")
+
+    # Clamp to a message that exists in this thread, so a stray id can't
+    # mark future messages read
+    stmt = select(func.max(Message.id)).where(Message.reservation_id == reservation_id)
+    if payload and payload.last_read_message_id is not None:
+        stmt = stmt.where(Message.id <= payload.last_read_message_id)
+    message_id = db.execute(stmt).scalar()
+
+    if message_id is None:
+        last_read = db.execute(
+            select(MessageReadCursor.last_read_message_id).where(
+                MessageReadCursor.user_id == current_user.id,
+                MessageReadCursor.reservation_id == reservation_id,
+            )
+        ).scalar() or 0
+    else:
+        last_read = advance_read_cursor(db, current_user.id, reservation_id, message_id)
+        db.commit()
+        # Only this user's unread badges changed
+        board_cache.invalidate(row.date, user_id=current_user.id)
+
+    _, unread = message_counts(db, current_user.id, [reservation_id]).get(reservation_id, (0, 0))
+    return MessageReadCursorResponse(
+        reservation_id=reservation_id,
+        last_read_message_id=last_read,
+        unread_count=unread,
+    )
+
+
 # -----------------------------------------------------------
 # Post message to reservation
 # -----------------------------------------------------------
@@ -60,4 +140,70 @@ def create_message(
     db.commit()
     db.refresh(message)
 
-    return message
\ No newline at end of file
+    message_bus.publish(reservation_topic(reservation.id), date_topic(reservation.date))
+    return message
+
+
+# -----------------------------------------------------------
+# Long-poll for new messages (one thread, or the staff inbox for a date)
+# -----------------------------------------------------------
+def _messages_after(db: Session, after_id: int, reservation_id: Optional[int], day: Optional[date]):
+    stmt = (
+        select(Message)
+        .options(selectinload(Message.sender))
+        .where(Message.id > after_id)
+        .order_by(Message.id.asc())
+        .limit(STREAM_BATCH)
+    )
+    if reservation_id is not None:
+        stmt = stmt.where(Message.reservation_id == reservation_id)
+    else:
+        stmt = stmt.join(Reservation, Reservation.id == Message.reservation_id).where(Reservation.date == day)
+    rows = db.execute(stmt).scalars().all()
+    return [MessageResponse.model_validate(m) for m in rows]
+
+
+@router.get("/stream", response_model=List[MessageResponse])
+async def stream_messages(
+    after_id: int = Query(0, ge=0, description="Return messages with id > after_id"),
+    reservation_id: Optional[int] = Query(None),
+    date: Optional[date] = Query(None, description="Staff inbox: every reservation on this date"),
+    timeout: float = Query(25, ge=0, le=STREAM_MAX_WAIT),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Returns new messages as soon as there are any, or [] after `timeout`
+    seconds. Clients loop, passing the last id they have as after_id.
+    The wait holds no DB connection and issues no queries; create_message
+    wakes it.
+    """
+    if (reservation_id is None) == (date is None):
+        raise HTTPException(status_code=422, detail="Pass exactly one of reservation_id or date")
+
+    if reservation_id is not None:
+        owner_id = await run_in_threadpool(
+            lambda: db.execute(
+                select(Reservation.user_id).where(Reservation.id == reservation_id)
+            ).scalar_one_or_none()
+        )
+        if owner_id is None:
+            raise HTTPException(status_code=404, detail="Reservation not found")
+        if owner_id != current_user.id and current_user.role not in ("admin", "staff"):
+            raise HTTPException(status_code=403, detail="Not allowed")
+        topic = reservation_topic(reservation_id)
+    else:
+        if current_user.role not in ("admin", "staff"):
+            raise HTTPException(status_code=403, detail="Staff only")
+        topic = date_topic(date)
+
+    seen = message_bus.sequence(topic)   # before the query: see message_bus
+    messages = await run_in_threadpool(_messages_after, db, after_id, reservation_id, date)
+    if messages or timeout == 0:
+        return messages
+
+    # Release the pooled connection for the duration of the wait
+    await run_in_threadpool(db.close)
+    if not await message_bus.wait(topic, seen, timeout):
+        return []
+    return await run_in_threadpool(_messages_after, db, after_id, reservation_id, date)
\ No newline at end of file
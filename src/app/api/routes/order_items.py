@@ -8,38 +8,22 @@ from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_user
 from app.api.deps.db import get_db
-from app.models.menu_item import MenuItem
-from app.models.order import Order
+from app.api.deps.orders import require_order_access
 from app.models.order_item import OrderItem
-from app.models.reservation_attendee import ReservationAttendee
 from app.models.user import User
 from app.schemas.order_items import OrderItemCreateRequest, OrderItemResponse, OrderItemUpdateRequest
+from app.services.menu_catalog import menu_catalog
 
 router = APIRouter(prefix="/order-items", tags=["order_items"])
 
 
-def _require_order_access(db: Session, user: User, order_id: int) -> Order:
-    order = db.get(Order, order_id)
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    attendee = db.get(ReservationAttendee, order.attendee_id)
-    if not attendee:
-        raise HTTPException(status_code=404, detail="Attendee not found")
-
-    if attendee.reservation.user_id != user.id and user.role not in ("admin", "staff"):
-        raise HTTPException(status_code=403, detail="Not allowed")
-
-    return order
-
-
 @router.get("/by-order/{order_id}", response_model=List[OrderItemResponse])
 def list_items_for_order(
     order_id: int,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    _require_order_access(db, user, order_id)
+    require_order_access(db, user, order_id)
 
     return (
         db.query(OrderItem)
@@ -56,13 +40,13 @@ def add_item_to_order(
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    order = _require_order_access(db, user, order_id)
+    access = require_order_access(db, user, order_id)
 
     # Lifecycle lock: members cannot add items to a fired or fulfilled order
-    if order.status in ("fired", "fulfilled") and user.role not in ("admin", "staff"):
+    if access.is_locked and user.role not in ("admin", "staff"):
         raise HTTPException(status_code=409, detail="Order is locked")
 
-    menu_item = db.get(MenuItem, payload.menu_item_id)
+    menu_item = menu_catalog.get_item(db, payload.menu_item_id)
     if not menu_item:
         raise HTTPException(status_code=404, detail="Menu item not found")
 
@@ -72,8 +56,7 @@ def add_item_to_order(
         quantity=payload.quantity,
         status=payload.status,
         meta=payload.meta,
-        name_snapshot=menu_item.name,
-        price_cents_snapshot=menu_item.price_cents,
+        menu_item_version_id=menu_catalog.version_id_for(db, menu_item),
     )
 
     db.add(item)
@@ -93,10 +76,10 @@ def update_order_item(
     if not item:
         raise HTTPException(status_code=404, detail="Order item not found")
 
-    order = _require_order_access(db, user, item.order_id)
+    access = require_order_access(db, user, item.order_id)
 
     # Lifecycle lock: members cannot edit items on a fired or fulfilled order
-    if order.status in ("fired", "fulfilled") and user.role not in ("admin", "staff"):
+    if access.is_locked and user.role not in ("admin", "staff"):
         raise HTTPException(status_code=409, detail="Order is locked")
 
     data = payload.model_dump(exclude_unset=True)
@@ -118,10 +101,10 @@ def delete_order_item(
     if not item:
         raise HTTPException(status_code=404, detail="Order item not found")
 
-    order = _require_order_access(db, user, item.order_id)
+    access = require_order_access(db, user, item.order_id)
 
     # Lifecycle lock: members cannot remove items from a fired or fulfilled order
-    if order.status in ("fired", "fulfilled") and user.role not in ("admin", "staff"):
+    if access.is_locked and user.role not in ("admin", "staff"):
         raise HTTPException(status_code=409, detail="Order is locked")
 
     db.delete(item)
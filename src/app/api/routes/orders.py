@@ -1,15 +1,18 @@
 # app/api/routes/orders.py
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from typing import Optional
 from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session, selectinload
 
 from app.api.deps.auth import get_current_user, get_current_user_optional
+from app.api.deps.concurrency import check_version, commit_versioned, require_if_match, set_etag
 from app.api.deps.db import get_db
+from app.api.deps.orders import require_attendee_access, require_order_access
+from app.core.dietary import conflict_mask, from_mask
 from app.models.order import Order
 from app.models.order_item import OrderItem
 from app.models.reservation import Reservation
@@ -18,37 +21,54 @@ from app.models.seat_assignment import SeatAssignment
 from app.models.table import Table
 from app.models.user import User
 from app.schemas.orders import OrderEnsureRequest, OrderResponse, OrderUpdateRequest
+from app.services.menu_catalog import menu_catalog
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
 
-def _require_attendee_ownership(db: Session, user: User, attendee_id: int) -> ReservationAttendee:
-    attendee = db.get(ReservationAttendee, attendee_id)
-    if not attendee:
-        raise HTTPException(status_code=404, detail="Attendee not found")
-    if attendee.reservation.user_id != user.id and user.role not in ("admin", "staff"):
-        raise HTTPException(status_code=403, detail="Not allowed")
-    return attendee
-
-
 def _require_staff(user: User) -> None:
     if user.role not in ("admin", "staff"):
         raise HTTPException(status_code=403, detail="Staff only")
 
 
+def _flag_allergen_conflicts(db: Session, item: OrderItem, needs: int) -> None:
+    """
+    Record restrictions the attendee has that the item does not accommodate in
+    item.meta["allergen_conflicts"]. Flags only — the kitchen decides.
+    Masks come from the menu catalog, so this adds no queries per line.
+    """
+    conflicts: list[str] = []
+    if needs and item.status != "canceled":
+        snapshot = menu_catalog.get_item(db, item.menu_item_id)
+        if snapshot is not None:
+            conflicts = from_mask(conflict_mask(needs, snapshot.dietary_mask))
+
+    meta = dict(item.meta or {})
+    if conflicts:
+        meta["allergen_conflicts"] = conflicts
+    else:
+        meta.pop("allergen_conflicts", None)
+    if meta != (item.meta or {}):
+        item.meta = meta or None
+
+
 @router.post("/ensure", response_model=OrderResponse)
 def ensure_order(
     payload: OrderEnsureRequest,
+    response: Response,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    attendee = _require_attendee_ownership(db, user, payload.attendee_id)
-    if attendee.order:
-        return attendee.order
-    order = Order(attendee_id=attendee.id, status="open")
+    access = require_attendee_access(db, user, payload.attendee_id)
+    if access.order_id is not None:
+        order = db.get(Order, access.order_id)
+        set_etag(response, order.version)
+        return order
+    order = Order(attendee_id=access.attendee_id, status="open")
     db.add(order)
     db.commit()
     db.refresh(order)
+    set_etag(response, order.version)
     return order
 
 
@@ -56,29 +76,32 @@ def ensure_order(
 def update_order(
     order_id: int,
     payload: OrderUpdateRequest,
+    response: Response,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
+    expected_version: Optional[int] = Depends(require_if_match),
 ):
-    order = db.get(Order, order_id)
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    _require_attendee_ownership(db, user, order.attendee_id)
+    access = require_order_access(db, user, order_id)
 
-    if order.status in ("fired", "fulfilled") and user.role not in ("admin", "staff"):
+    if access.is_locked and user.role not in ("admin", "staff"):
         raise HTTPException(status_code=409, detail="Order is locked")
 
+    order = db.get(Order, order_id)
+    check_version(order.version, expected_version)
+
     data = payload.model_dump(exclude_unset=True)
     for k, v in data.items():
         setattr(order, k, v)
-    db.commit()
+    commit_versioned(db)
     db.refresh(order)
+    set_etag(response, order.version)
     return order
 
 
 @router.post("/{order_id}/fire", response_model=OrderResponse)
 def fire_order(
     order_id: int,
+    response: Response,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
@@ -86,7 +109,8 @@ def fire_order(
     _require_staff(user)
 
     order = db.query(Order).options(
-        selectinload(Order.items)
+        selectinload(Order.items),
+        selectinload(Order.attendee),
     ).filter(Order.id == order_id).first()
 
     if not order:
@@ -100,12 +124,15 @@ def fire_order(
         raise HTTPException(status_code=400, detail="Cannot fire an empty order")
 
     order.status = "fired"
+    needs = order.attendee.dietary_mask
     for item in order.items:
         if item.status == "selected":
             item.status = "confirmed"
+        _flag_allergen_conflicts(db, item, needs)
 
-    db.commit()
+    commit_versioned(db)
     db.refresh(order)
+    set_etag(response, order.version)
     return order
 
 
@@ -164,15 +191,20 @@ def get_chit(
 
     items_html = ""
     for item in order.items:
-        if item.status in ("selected", "confirmed"):
+        if item.status in ("selected", "confirmed", "preparing"):
+            conflicts = (item.meta or {}).get("allergen_conflicts")
+            warning = f"<br><strong>!! {', '.join(conflicts)}</strong>" if conflicts else ""
             items_html += f"""
             <tr>
-                <td>{item.name_snapshot or "—"}</td>
+                <td>{item.name_snapshot or "—"}{warning}</td>
                 <td>{item.quantity}</td>
                 <td>${(item.price_cents_snapshot or 0) / 100:.2f}</td>
             </tr>"""
 
-    fired_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    if order.fired_at is not None:
+        fired_at = order.fired_at.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    else:
+        fired_at = "Not fired"
 
     html = f"""<!DOCTYPE html>
 <html>
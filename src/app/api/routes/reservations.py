@@ -4,10 +4,11 @@ from __future__ import annotations
 from datetime import date
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session, selectinload
 
 from app.api.deps.auth import get_current_user
+from app.api.deps.concurrency import check_version, commit_versioned, require_if_match, set_etag
 from app.api.deps.db import get_db
 from app.models.order import Order
 from app.models.reservation import Reservation
@@ -87,6 +88,7 @@ def list_reservations(
 @router.post("", response_model=ReservationRead, status_code=201)
 def create_reservation(
     payload: ReservationCreate,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -102,6 +104,7 @@ def create_reservation(
     db.add(reservation)
     db.commit()
     db.refresh(reservation)
+    set_etag(response, reservation.version)
     return reservation
 
 
@@ -109,6 +112,7 @@ def create_reservation(
 @router.get("/{reservation_id}", response_model=ReservationRead)
 def get_reservation(
     reservation_id: int,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -120,6 +124,7 @@ def get_reservation(
     if not is_staff and reservation.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not allowed")
 
+    set_etag(response, reservation.version)
     return reservation
 
 
@@ -128,8 +133,10 @@ def get_reservation(
 def update_reservation(
     reservation_id: int,
     payload: ReservationUpdate,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    expected_version: Optional[int] = Depends(require_if_match),
 ):
     reservation = db.get(Reservation, reservation_id)
     if not reservation:
@@ -139,6 +146,8 @@ def update_reservation(
     if not is_staff and reservation.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not allowed")
 
+    check_version(reservation.version, expected_version)
+
     data = payload.model_dump(exclude_unset=True)
 
     # Lifecycle lock for members only — staff can update freely
@@ -160,8 +169,9 @@ def update_reservation(
     for k, v in data.items():
         setattr(reservation, k, v)
 
-    db.commit()
+    commit_versioned(db)
     db.refresh(reservation)
+    set_etag(response, reservation.version)
     return reservation
 
 
@@ -1,22 +1,22 @@
 # app/api/routes/schema.py
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+import json
+from functools import lru_cache
+from typing import Tuple
+
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
 from app.api.deps.auth import get_current_user
 from app.api.deps.db import get_db
+from app.core.dietary import DIETARY_RESTRICTIONS
+from app.core.http_cache import etag_for_bytes, json_bytes_response
 from app.models.user import User
-from app.models.table import Table
+from app.services.table_capacity import table_capacity
 
 router = APIRouter(prefix="/schema", tags=["schema"])
 
-DIETARY_OPTIONS = [
-    "dairy_free", "egg_free", "fish_allergy", "gluten_free",
-    "halal", "kosher", "nut_allergy", "peanut_allergy",
-    "sesame_allergy", "shellfish_allergy", "soy_free", "vegan", "vegetarian"
-]
 
 SCHEMA = {
     "reservation": {
@@ -45,7 +45,7 @@ SCHEMA = {
             "dietary_restrictions": {
                 "type": "multiselect", "required": False,
                 "label": "Dietary Restrictions",
-                "options": DIETARY_OPTIONS
+                "options": DIETARY_RESTRICTIONS
             },
             "selection_confirmed": { "type": "boolean", "required": False,
                                      "label": "Selection Confirmed", "default": False },
@@ -82,7 +82,7 @@ SCHEMA = {
             "quantity":     { "type": "number",      "required": False, "label": "Quantity",
                               "min": 1, "default": 1 },
             "status":       { "type": "enum",        "required": False, "label": "Status",
-                              "options": ["selected", "confirmed", "served", "canceled"],
+                              "options": ["selected", "confirmed", "preparing", "served", "canceled"],
                               "default": "selected" },
         },
         "display": {
@@ -103,7 +103,7 @@ SCHEMA = {
             "dietary_restrictions": {
                 "type": "multiselect", "required": False,
                 "label": "Dietary Restrictions",
-                "options": DIETARY_OPTIONS
+                "options": DIETARY_RESTRICTIONS
             },
         },
     },
@@ -121,7 +121,7 @@ SCHEMA = {
             "dietary_restrictions": {
                 "type": "multiselect", "required": False,
                 "label": "Dietary Accommodations",
-                "options": DIETARY_OPTIONS,
+                "options": DIETARY_RESTRICTIONS,
                 "note": "What this item accommodates"
             },
             "is_active":   { "type": "boolean",  "required": False, "label": "Active",
@@ -195,26 +195,30 @@ SCHEMA = {
 }
 
 
+@lru_cache(maxsize=32)
+def _payload(is_admin: bool, max_party_size: int) -> Tuple[bytes, str]:
+    """Serialized schema for a role and capacity, with its strong ETag."""
+    schema = SCHEMA if is_admin else {
+        k: v for k, v in SCHEMA.items()
+        if not v.get("admin_only") and not v.get("staff_only")
+    }
+    body = json.dumps(
+        {**schema, "_config": {"max_party_size": max_party_size}},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return body, etag_for_bytes(body)
+
+
 @router.get("")
 def get_schema(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    max_capacity = (
-        db.query(func.max(Table.seat_count))
-        .filter(Table.is_active == True)
-        .scalar() or 4
+    # SCHEMA is static, so the only input that changes is max_party_size
+    # (cached until a table endpoint writes); each (role, capacity) pair is
+    # serialized once.
+    body, etag = _payload(
+        current_user.role == "admin", table_capacity.max_party_size(db)
     )
-
-    schema = SCHEMA if current_user.role == "admin" else {
-        k: v for k, v in SCHEMA.items()
-        if not v.get("admin_only") and not v.get("staff_only")
-    }
-
-    return {
-        **schema,
-        "_config": {
-            "max_party_size": max_capacity
-        }
-    }
-
+    return json_bytes_response(request, body, etag)
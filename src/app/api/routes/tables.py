@@ -11,6 +11,8 @@ from app.api.deps.db import get_db
 from app.models.table import Table
 from app.models.user import User
 from app.schemas.table import TableCreate, TableRead
+from app.services import bulk
+from app.services.table_capacity import table_capacity
 
 router = APIRouter(prefix="/tables", tags=["tables"])
 
@@ -50,12 +52,11 @@ def create_table(
     table = Table(**payload.model_dump())
     db.add(table)
     db.commit()
+    table_capacity.invalidate()
     db.refresh(table)
     return table
 
 
-from sqlalchemy.exc import IntegrityError
-
 @router.delete("/{table_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_table(
     table_id: int,
@@ -63,16 +64,9 @@ def delete_table(
     current_user: User = Depends(get_current_user),
 ):
     _require_admin(current_user)
-    table = db.get(Table, table_id)
-    if not table:
+    # Same as DELETE /admin/tables/{id}: the table's seat assignments go with it
+    if not bulk.delete_table(db, table_id)["tables"]:
         raise HTTPException(status_code=404, detail="Table not found")
-    try:
-        db.delete(table)
-        db.commit()
-    except IntegrityError:
-        db.rollback()
-        raise HTTPException(
-            status_code=409,
-            detail="Cannot delete table — it has active seat assignments. Remove assignments first."
-        )
+    db.commit()
+    table_capacity.invalidate()
     return None
\ No newline at end of file
@@ -0,0 +1,36 @@
+# app/core/dietary.py
+from __future__ import annotations
+
+from typing import Iterable, List, Optional
+
+# Single source of truth for dietary restriction values (Postgres enum,
+# API validation, /api/schema options).
+#
+# Bit i of a dietary mask is DIETARY_RESTRICTIONS[i]. Masks are stored
+# (menu_items.dietary_mask, reservation_attendees.dietary_mask), so only
+# ever APPEND to this list — reordering would silently remap stored bits.
+DIETARY_RESTRICTIONS = [
+    "dairy_free", "egg_free", "fish_allergy", "gluten_free",
+    "halal", "kosher", "nut_allergy", "peanut_allergy",
+    "sesame_allergy", "shellfish_allergy", "soy_free",
+    "vegan", "vegetarian",
+]
+
+DIETARY_BITS = {name: 1 << i for i, name in enumerate(DIETARY_RESTRICTIONS)}
+
+
+def to_mask(values: Optional[Iterable[str]]) -> int:
+    """Encode restriction names as a bitmask; unknown names are ignored."""
+    mask = 0
+    for v in values or ():
+        mask |= DIETARY_BITS.get(getattr(v, "value", v), 0)
+    return mask
+
+
+def from_mask(mask: int) -> List[str]:
+    return [name for name, bit in DIETARY_BITS.items() if mask & bit]
+
+
+def conflict_mask(needs: int, accommodates: int) -> int:
+    """Restrictions the attendee needs that the item does not accommodate."""
+    return needs & ~accommodates
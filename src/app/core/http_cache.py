@@ -0,0 +1,38 @@
+# app/core/http_cache.py
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def etag_for_bytes(body: bytes) -> str:
+    """Strong ETag derived from the payload itself (stable across restarts)."""
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """True when the client already holds `etag` (→ answer 304)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return etag in candidates
+
+
+def json_bytes_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_control: Optional[str] = "no-cache",
+) -> Response:
+    """Serve pre-serialized JSON with ETag, or an empty 304 on a conditional hit."""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -25,11 +25,14 @@ class Base(DeclarativeBase):
 
 
 # ── 2. Engine with production-friendly pooling ──
+POOL_SIZE = 10                  # persistent connections
+MAX_OVERFLOW = 20               # allow bursts (e.g. dinner rush)
+
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,         # detect & recover broken connections
-    pool_size=10,               # persistent connections
-    max_overflow=20,            # allow bursts (e.g. dinner rush)
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
     pool_timeout=30,            # wait time before raising error
     pool_recycle=1800,          # recycle after ~30 min to avoid stale connections
     echo=settings.ENV == "dev", # show SQL in development only
@@ -10,10 +10,11 @@ from fastapi.security import HTTPBearer
 
 # Internal Imports
 from app.core.config import get_settings
+from app.services.health_probe import health_prober
 from app.api.routes import (
     auth, users, members, reservations, reservation_attendees,
     menu_items, orders, order_items, messages, dining_rooms,
-    tables, seat_assignments, admin, schema, health
+    tables, seat_assignments, admin, schema, health, kitchen, menu
 )
 
 # ── 0. PATH CONFIGURATION ──
@@ -48,8 +49,9 @@ except Exception as e:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     audit_api_routes(app)           # run audit at startup
+    health_prober.start()           # feeds /health/ready
     yield
-    # shutdown logic can go here later (db pools, etc.)
+    health_prober.stop()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -60,8 +62,8 @@ app.add_middleware(
     allow_origin_regex=r"https://.*\.netlify\.app",
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["Authorization", "Content-Type", "Accept"],
-    expose_headers=["Authorization"],
+    allow_headers=["Authorization", "Content-Type", "Accept", "If-Match", "If-None-Match"],
+    expose_headers=["Authorization", "ETag", "X-Next-Cursor", "X-Total-Count"],
     max_age=86400,
 )
 
@@ -81,13 +83,14 @@ app.include_router(users.router,     prefix=API_PREFIX, tags=["Users"])
 app.include_router(members.router,   prefix=API_PREFIX, tags=["Members"])
 
 # Logistics
-for router_mod in [reservations, reservation_attendees, menu_items,
+for router_mod in [reservations, reservation_attendees, menu_items, menu,
                    dining_rooms, tables, seat_assignments]:
     app.include_router(router_mod.router, prefix=API_PREFIX, tags=["Logistics"])
 
 # Business
 app.include_router(orders.router,       prefix=API_PREFIX, tags=["Orders"])
 app.include_router(order_items.router,  prefix=API_PREFIX, tags=["Orders"])
+app.include_router(kitchen.router,      prefix=API_PREFIX, tags=["Kitchen"])
 app.include_router(messages.router,     prefix=API_PREFIX, tags=["Messages"])
 app.include_router(admin.router,        prefix=API_PREFIX, tags=["Admin"])
 
@@ -117,6 +120,9 @@ def custom_openapi():
         f"{API_PREFIX}/auth/refresh",   # ← add if you have refresh endpoint
         f"{API_PREFIX}/health",
         f"{API_PREFIX}/health/",
+        f"{API_PREFIX}/health/live",
+        f"{API_PREFIX}/health/ready",
+        f"{API_PREFIX}/menu",
     }
 
     for path, path_item in openapi_schema["paths"].items():
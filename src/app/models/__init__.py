@@ -5,9 +5,11 @@ from .member import Member
 from .reservation import Reservation
 from .reservation_attendee import ReservationAttendee
 from .menu_item import MenuItem
+from .menu_item_version import MenuItemVersion
 from .order import Order
 from .order_item import OrderItem
 from .message import Message
+from .message_read_cursor import MessageReadCursor
 from .dining_room import DiningRoom
 from .table import Table
 from .seat_assignment import SeatAssignment
@@ -3,23 +3,17 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String, ForeignKey, DateTime, text
+from sqlalchemy import String, ForeignKey, DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import ARRAY, ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.dietary import DIETARY_RESTRICTIONS
 from app.database import Base
 
 if TYPE_CHECKING:
     from app.models.user import User
     from app.models.reservation_attendee import ReservationAttendee
 
-DIETARY_RESTRICTIONS = [
-    "dairy_free", "egg_free", "fish_allergy", "gluten_free",
-    "halal", "kosher", "nut_allergy", "peanut_allergy",
-    "sesame_allergy", "shellfish_allergy", "soy_free",
-    "vegan", "vegetarian",
-]
-
 dietary_enum = ENUM(
     *DIETARY_RESTRICTIONS,
     name="dietary_restriction_enum",
@@ -77,4 +71,13 @@ class Member(Base):
     )
 
     def __repr__(self) -> str:
-        return f"<Member(id={self.id}, name={self.name!r}, relation={self.relation!r})>"
\ No newline at end of file
+        return f"<Member(id={self.id}, name={self.name!r}, relation={self.relation!r})>"
+
+
+# Typeahead (/admin/search/people): serves lower(name) LIKE 'q%' and q <% lower(name)
+Index(
+    "ix_members_name_trgm",
+    func.lower(Member.name).label("name_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"name_lower": "gin_trgm_ops"},
+)
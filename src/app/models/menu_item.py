@@ -1,13 +1,17 @@
 # app/models/menu_item.py
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import Any, List, Optional, TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Integer, String, func
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, event, func, inspect
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.dietary import to_mask
 from app.database import Base
+from app.models.menu_item_version import ensure_menu_item_version
 
 if TYPE_CHECKING:
     from app.models.order_item import OrderItem
@@ -22,10 +26,20 @@ class MenuItem(Base):
     - Inactive items remain queryable for historical order item references.
     """
     __tablename__ = "menu_items"
+    __table_args__ = (
+        # jsonb_path_ops GIN: serves `dietary_restrictions @> '["gluten_free", ...]'`
+        Index(
+            "ix_menu_items_dietary_restrictions",
+            "dietary_restrictions",
+            postgresql_using="gin",
+            postgresql_ops={"dietary_restrictions": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
-    name: Mapped[str] = mapped_column(String(140), nullable=False, index=True)
+    # Unique: the natural key for data imports (INSERT ... ON CONFLICT (name))
+    name: Mapped[str] = mapped_column(String(140), nullable=False, unique=True, index=True)
     description: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     price_cents: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -38,10 +52,19 @@ class MenuItem(Base):
         JSONB, nullable=False, default=list, server_default="[]"
     )
 
+    # Bitmask of the accommodations above (see app.core.dietary), kept in sync on flush
+    dietary_mask: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
     is_active: Mapped[bool] = mapped_column(
         Boolean, nullable=False, default=True, server_default="true", index=True
     )
 
+    # menu_content_hash() of the imported fields, kept in sync on flush.
+    # The importer skips rows whose hash is unchanged; NULL means "never hashed".
+    content_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+
     created_at: Mapped[Any] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
@@ -55,4 +78,42 @@ class MenuItem(Base):
     order_items: Mapped[List["OrderItem"]] = relationship(
         "OrderItem",
         back_populates="menu_item",
-    )
\ No newline at end of file
+    )
+
+
+def menu_content_hash(
+    name: str,
+    description: Optional[str],
+    price_cents: int,
+    dietary_restrictions: Optional[List[str]],
+    is_active: bool,
+) -> str:
+    """Stable digest of the fields scripts/data/import_menu_json.py manages."""
+    payload = json.dumps(
+        [name, description or "", price_cents, sorted(dietary_restrictions or []), bool(is_active)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@event.listens_for(MenuItem, "before_insert")
+@event.listens_for(MenuItem, "before_update")
+def _menu_item_derived_columns(mapper, connection, target: MenuItem) -> None:
+    target.dietary_mask = to_mask(target.dietary_restrictions)
+    target.content_hash = menu_content_hash(
+        target.name,
+        target.description,
+        target.price_cents,
+        target.dietary_restrictions,
+        target.is_active if target.is_active is not None else True,
+    )
+
+
+@event.listens_for(MenuItem, "after_insert")
+@event.listens_for(MenuItem, "after_update")
+def _menu_item_version(mapper, connection, target: MenuItem) -> None:
+    # Order items reference versions; make sure the current (name, price) has one
+    state = inspect(target)
+    if state.attrs.name.history.has_changes() or state.attrs.price_cents.history.has_changes():
+        ensure_menu_item_version(connection, target.id, target.name, target.price_cents)
@@ -0,0 +1,77 @@
+# app/models/menu_item_version.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Union
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, UniqueConstraint, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
+
+from app.database import Base
+
+if TYPE_CHECKING:
+    from app.models.menu_item import MenuItem
+
+
+class MenuItemVersion(Base):
+    """
+    Immutable (name, price) of a menu item at some point in time.
+    Order items point here instead of copying name/price onto every line.
+
+    Rows are never updated: a new row appears only when a menu item's name
+    or price changes. Changing back reuses the old row (unique triple).
+    """
+    __tablename__ = "menu_item_versions"
+    __table_args__ = (
+        UniqueConstraint(
+            "menu_item_id", "name", "price_cents",
+            name="uq_menu_item_versions_item_name_price",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    menu_item_id: Mapped[int] = mapped_column(
+        ForeignKey("menu_items.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    name: Mapped[str] = mapped_column(String(140), nullable=False)
+
+    # Indexed for "orders by price point" reporting
+    price_cents: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("TIMEZONE('utc', now())"),
+    )
+
+    menu_item: Mapped["MenuItem"] = relationship("MenuItem")
+
+
+def ensure_menu_item_version(
+    bind: Union[Session, Connection],
+    menu_item_id: int,
+    name: str,
+    price_cents: int,
+) -> int:
+    """Id of the matching version row, inserting it if it doesn't exist yet."""
+    table = MenuItemVersion.__table__
+    version_id = bind.execute(
+        insert(table)
+        .values(menu_item_id=menu_item_id, name=name, price_cents=price_cents)
+        .on_conflict_do_nothing(constraint="uq_menu_item_versions_item_name_price")
+        .returning(table.c.id)
+    ).scalar()
+    if version_id is None:
+        version_id = bind.execute(
+            select(table.c.id).where(
+                table.c.menu_item_id == menu_item_id,
+                table.c.name == name,
+                table.c.price_cents == price_cents,
+            )
+        ).scalar_one()
+    return version_id
@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, DateTime, Text
+from sqlalchemy import ForeignKey, DateTime, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -20,13 +20,17 @@ class Message(Base):
     Used for organizer <-> staff communication.
     """
     __tablename__ = "messages"
+    __table_args__ = (
+        # Thread pages: WHERE reservation_id = ? AND (created_at, id) > (?, ?)
+        # ORDER BY created_at, id — also serves plain reservation_id lookups
+        Index("ix_messages_reservation_id_created_at_id", "reservation_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
     reservation_id: Mapped[int] = mapped_column(
         ForeignKey("reservations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     sender_user_id: Mapped[int] = mapped_column(
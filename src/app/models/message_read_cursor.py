@@ -0,0 +1,99 @@
+# app/models/message_read_cursor.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable, Tuple, Union
+
+from sqlalchemy import DateTime, ForeignKey, Integer, and_, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from sqlalchemy.sql import Select
+
+from app.database import Base
+from app.models.message import Message
+
+
+class MessageReadCursor(Base):
+    """
+    How far a user has read a reservation's thread.
+
+    Message ids only grow, so "read" is a single watermark: everything with
+    id <= last_read_message_id has been seen. No row means nothing read.
+    """
+    __tablename__ = "message_read_cursors"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    reservation_id: Mapped[int] = mapped_column(
+        ForeignKey("reservations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Not a FK: the watermark stays valid if that message is deleted
+    last_read_message_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("TIMEZONE('utc', now())"),
+    )
+
+
+def advance_read_cursor(db: Session, user_id: int, reservation_id: int, message_id: int) -> int:
+    """Move the cursor forward to message_id (never back). Returns the stored watermark."""
+    table = MessageReadCursor.__table__
+    stmt = insert(table).values(
+        user_id=user_id, reservation_id=reservation_id, last_read_message_id=message_id,
+    )
+    return db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.reservation_id],
+            set_={
+                "last_read_message_id": func.greatest(
+                    table.c.last_read_message_id, stmt.excluded.last_read_message_id,
+                ),
+                "updated_at": func.now(),
+            },
+        ).returning(table.c.last_read_message_id)
+    ).scalar_one()
+
+
+def message_counts_query(user_id: int, reservation_ids: Union[Select, Iterable[int]]) -> Select:
+    """
+    (reservation_id, total, unread) per reservation in `reservation_ids`
+    (ids or a subquery) that has messages. A message is unread for
+    `user_id` when it is past their cursor and someone else sent it.
+    """
+    unread = and_(
+        Message.id > func.coalesce(MessageReadCursor.last_read_message_id, 0),
+        Message.sender_user_id != user_id,
+    )
+    return (
+        select(
+            Message.reservation_id,
+            func.count().label("total"),
+            func.count().filter(unread).label("unread"),
+        )
+        .outerjoin(
+            MessageReadCursor,
+            and_(
+                MessageReadCursor.reservation_id == Message.reservation_id,
+                MessageReadCursor.user_id == user_id,
+            ),
+        )
+        .where(Message.reservation_id.in_(reservation_ids))
+        .group_by(Message.reservation_id)
+    )
+
+
+def message_counts(
+    db: Session,
+    user_id: int,
+    reservation_ids: Union[Select, Iterable[int]],
+) -> Dict[int, Tuple[int, int]]:
+    """{reservation_id: (message_count, unread_count)}; see message_counts_query."""
+    rows = db.execute(message_counts_query(user_id, reservation_ids))
+    return {rid: (total, unread) for rid, total, unread in rows}
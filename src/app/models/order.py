@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, text
+from sqlalchemy import DateTime, ForeignKey, Integer, String, event, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -38,12 +38,31 @@ class Order(Base):
         nullable=True,
     )
 
+    # Optimistic concurrency: bumped on every ORM UPDATE, exposed as the ETag
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="1",
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
         server_default=text("TIMEZONE('utc', now())"),
     )
 
+    # Lifecycle timestamps for kitchen ticket times (stamped by the status listener below)
+    fired_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        index=True,
+    )
+
+    fulfilled_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -64,5 +83,17 @@ class Order(Base):
         passive_deletes=True,
     )
 
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self) -> str:
-        return f"<Order(id={self.id}, attendee_id={self.attendee_id}, status={self.status!r})>"
\ No newline at end of file
+        return f"<Order(id={self.id}, attendee_id={self.attendee_id}, status={self.status!r})>"
+
+
+@event.listens_for(Order.status, "set")
+def _order_status_set(target: Order, value, oldvalue, initiator) -> None:
+    # First transition wins; re-setting the same status keeps the original stamp.
+    now = datetime.now(timezone.utc)
+    if value == "fired" and target.fired_at is None:
+        target.fired_at = now
+    elif value == "fulfilled" and target.fulfilled_at is None:
+        target.fulfilled_at = now
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional, Dict, Any
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, JSON, text
+from sqlalchemy import DateTime, ForeignKey, Integer, String, JSON, event, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -11,12 +11,14 @@ from app.database import Base
 if TYPE_CHECKING:
     from app.models.order import Order
     from app.models.menu_item import MenuItem
+    from app.models.menu_item_version import MenuItemVersion
 
 
 class OrderItem(Base):
     """
     One line item in an attendee's Order.
-    Snapshots are mandatory to preserve price/name at order time (audit/fiscal integrity).
+    Name/price at order time come from the referenced MenuItemVersion
+    (name_snapshot / price_cents_snapshot are read-through properties).
     """
     __tablename__ = "order_items"
 
@@ -41,7 +43,7 @@ class OrderItem(Base):
         server_default="1",
     )
 
-    # "selected" → "ordered" → "served" → "canceled" (or similar flow)
+    # "selected" → "confirmed" (fired) → "preparing" (claimed by a station) → "served"; or "canceled"
     status: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
@@ -50,15 +52,12 @@ class OrderItem(Base):
         index=True,
     )
 
-    # REQUIRED snapshots – protect against menu changes after order
-    name_snapshot: Mapped[str] = mapped_column(
-        String(140),
-        nullable=False,
-    )
-
-    price_cents_snapshot: Mapped[int] = mapped_column(
-        Integer,
+    # REQUIRED – the menu item's (name, price) at order time (audit/fiscal integrity).
+    # Versions are immutable, so later menu edits never change this line.
+    menu_item_version_id: Mapped[int] = mapped_column(
+        ForeignKey("menu_item_versions.id", ondelete="RESTRICT"),
         nullable=False,
+        index=True,
     )
 
     # Optional: special requests, customizations, allergies notes, etc.
@@ -74,6 +73,12 @@ class OrderItem(Base):
         server_default=text("TIMEZONE('utc', now())"),
     )
 
+    # Set when the item reaches "served"; ticket time is served_at - order.fired_at
+    served_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -89,4 +94,25 @@ class OrderItem(Base):
     menu_item: Mapped["MenuItem"] = relationship(
         "MenuItem",
         back_populates="order_items",
-    )
\ No newline at end of file
+    )
+
+    # Joined on every load: name/price are needed wherever a line is shown
+    menu_item_version: Mapped["MenuItemVersion"] = relationship(
+        "MenuItemVersion",
+        lazy="joined",
+        innerjoin=True,
+    )
+
+    @property
+    def name_snapshot(self) -> str:
+        return self.menu_item_version.name
+
+    @property
+    def price_cents_snapshot(self) -> int:
+        return self.menu_item_version.price_cents
+
+
+@event.listens_for(OrderItem.status, "set")
+def _order_item_status_set(target: OrderItem, value, oldvalue, initiator) -> None:
+    if value == "served" and target.served_at is None:
+        target.served_at = datetime.now(timezone.utc)
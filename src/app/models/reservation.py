@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import datetime, date, time, timezone
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Date, Time, event
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Date, Time, event, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -44,6 +44,15 @@ def _make_reservation_code(res: "Reservation") -> str:
     return f"{lodge}-{d}-{st}-{dr}-{u}-{rid}"
 
 
+def fts_vector(column):
+    """
+    to_tsvector('simple', coalesce(column, '')) — the exact expression the
+    full-text GIN indexes are built on; queries must use it verbatim to hit them.
+    'simple' (no stemming) because the indexed text is mostly names.
+    """
+    return func.to_tsvector(text("'simple'::regconfig"), func.coalesce(column, text("''")))
+
+
 class Reservation(Base):
     __tablename__ = "reservations"
 
@@ -85,6 +94,13 @@ class Reservation(Base):
         unique=True,
     )
 
+    # Optimistic concurrency: bumped on every ORM UPDATE, exposed as the ETag
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="1",
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -120,6 +136,18 @@ class Reservation(Base):
         uselist=False,
     )
 
+    __mapper_args__ = {"version_id_col": version}
+
+
+# Reservation search (/admin/search/reservations)
+# Code-prefix lookups: reservation_code LIKE 'ABY-20260224-18%' (the unique index can't do LIKE)
+Index(
+    "ix_reservations_reservation_code_pattern",
+    Reservation.reservation_code,
+    postgresql_ops={"reservation_code": "text_pattern_ops"},
+)
+Index("ix_reservations_notes_fts", fts_vector(Reservation.notes), postgresql_using="gin")
+
 
 @event.listens_for(Reservation, "before_insert")
 def _reservation_before_insert(mapper, connection, target: Reservation) -> None:
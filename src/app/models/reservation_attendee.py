@@ -3,25 +3,19 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, List, Optional, Dict, Any
 
-from sqlalchemy import ForeignKey, String, DateTime, JSON, Boolean, text
+from sqlalchemy import ForeignKey, Index, Integer, String, DateTime, JSON, Boolean, event, func, text
 from sqlalchemy.dialects.postgresql import ARRAY, ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.dietary import DIETARY_RESTRICTIONS, to_mask
 from app.database import Base
+from app.models.reservation import fts_vector
 
 if TYPE_CHECKING:
     from app.models.reservation import Reservation
     from app.models.member import Member
     from app.models.order import Order
 
-
-DIETARY_RESTRICTIONS = [
-    "dairy_free", "egg_free", "fish_allergy", "gluten_free",
-    "halal", "kosher", "nut_allergy", "peanut_allergy",
-    "sesame_allergy", "shellfish_allergy", "soy_free",
-    "vegan", "vegetarian",
-]
-
 dietary_enum = ENUM(
     *DIETARY_RESTRICTIONS,
     name="dietary_restriction_enum",
@@ -57,6 +51,14 @@ class ReservationAttendee(Base):
         server_default=text("'{}'::dietary_restriction_enum[]"),
     )
 
+    # Bitmask of dietary_restrictions (see app.core.dietary), kept in sync on flush
+    dietary_mask: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
     meta: Mapped[Optional[Dict[str, Any]]] = mapped_column(
         JSON,
         nullable=True,
@@ -102,4 +104,26 @@ class ReservationAttendee(Base):
 
     def __repr__(self) -> str:
         name = self.guest_name or f"Member {self.member_id}"
-        return f"<ReservationAttendee(id={self.id}, name={name!r}, confirmed={self.selection_confirmed})>"
\ No newline at end of file
+        return f"<ReservationAttendee(id={self.id}, name={name!r}, confirmed={self.selection_confirmed})>"
+
+
+# Typeahead (/admin/search/people): serves lower(guest_name) LIKE 'q%' and q <% lower(guest_name)
+Index(
+    "ix_reservation_attendees_guest_name_trgm",
+    func.lower(ReservationAttendee.guest_name).label("guest_name_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"guest_name_lower": "gin_trgm_ops"},
+)
+
+# Reservation search (/admin/search/reservations): full-text over guest names
+Index(
+    "ix_reservation_attendees_guest_name_fts",
+    fts_vector(ReservationAttendee.guest_name),
+    postgresql_using="gin",
+)
+
+
+@event.listens_for(ReservationAttendee, "before_insert")
+@event.listens_for(ReservationAttendee, "before_update")
+def _attendee_dietary_mask(mapper, connection, target: ReservationAttendee) -> None:
+    target.dietary_mask = to_mask(target.dietary_restrictions)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List, TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, JSON, String
+from sqlalchemy import Boolean, DateTime, Index, JSON, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -69,4 +69,13 @@ class User(Base):
     )
 
     def __repr__(self) -> str:
-        return f"<User(email={self.email!r}, role={self.role}, active={self.is_active})>"
\ No newline at end of file
+        return f"<User(email={self.email!r}, role={self.role}, active={self.is_active})>"
+
+
+# Typeahead (/admin/search/people): serves lower(email) LIKE 'q%' and q <% lower(email)
+Index(
+    "ix_users_email_trgm",
+    func.lower(User.email).label("email_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"email_lower": "gin_trgm_ops"},
+)
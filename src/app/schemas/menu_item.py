@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -41,4 +41,19 @@ class MenuItemResponse(BaseModel):
     dietary_restrictions: List[str] = Field(default_factory=list)
     is_active: bool
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+
+class MenuCategory(BaseModel):
+    category: Optional[str] = None
+    item_count: int
+    # tag → number of items in this category carrying it
+    dietary_counts: Dict[str, int] = Field(default_factory=dict)
+    items: List[MenuItemResponse] = Field(default_factory=list)
+
+
+class MenuResponse(BaseModel):
+    """GET /api/menu — the active menu grouped by category (uncategorized last)."""
+    item_count: int
+    dietary_counts: Dict[str, int] = Field(default_factory=dict)
+    categories: List[MenuCategory] = Field(default_factory=list)
@@ -1,9 +1,13 @@
 # app/schemas/messages.py
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+from typing import List, Literal, Optional
+
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.reservation import ReservationStatus
+
 
 class MessageSender(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -17,6 +21,15 @@ class MessageCreate(BaseModel):
     body: str = Field(min_length=1)
 
 
+class MessageBroadcast(BaseModel):
+    """Same body posted to every reservation matching the filters."""
+    body: str = Field(min_length=1)
+    date: date
+    dining_room_id: Optional[int] = None
+    meal: Optional[Literal["breakfast", "lunch", "dinner"]] = None
+    statuses: List[ReservationStatus] = Field(default=["draft", "confirmed"], min_length=1)
+
+
 class MessageResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -24,4 +37,15 @@ class MessageResponse(BaseModel):
     reservation_id: int
     body: str
     created_at: datetime
-    sender: MessageSender
\ No newline at end of file
+    sender: MessageSender
+
+
+class MessageReadUpdate(BaseModel):
+    # Defaults to the newest message in the thread
+    last_read_message_id: Optional[int] = Field(default=None, ge=1)
+
+
+class MessageReadCursorResponse(BaseModel):
+    reservation_id: int
+    last_read_message_id: int
+    unread_count: int
@@ -15,9 +15,11 @@ class OrderItemResponse(BaseModel):
     menu_item_id: int
     quantity: int
     status: str
+    menu_item_version_id: int
     name_snapshot: Optional[str] = None
     price_cents_snapshot: Optional[int] = None
     meta: Optional[Dict[str, Any]] = None
+    served_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
@@ -14,6 +14,9 @@ class OrderResponse(BaseModel):
     attendee_id: int
     status: str
     notes: Optional[str] = None
+    version: int
+    fired_at: Optional[datetime] = None
+    fulfilled_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
@@ -40,5 +40,6 @@ class ReservationRead(ReservationBase):
 
     id: int
     user_id: int
+    version: int
     created_at: datetime
     updated_at: datetime
\ No newline at end of file
@@ -7,21 +7,15 @@ from enum import Enum
 
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 
+from app.core.dietary import DIETARY_RESTRICTIONS
 
-class DietaryRestriction(str, Enum):
-    dairy_free = "dairy_free"
-    egg_free = "egg_free"
-    fish_allergy = "fish_allergy"
-    gluten_free = "gluten_free"
-    halal = "halal"
-    kosher = "kosher"
-    nut_allergy = "nut_allergy"
-    peanut_allergy = "peanut_allergy"
-    sesame_allergy = "sesame_allergy"
-    shellfish_allergy = "shellfish_allergy"
-    soy_free = "soy_free"
-    vegan = "vegan"
-    vegetarian = "vegetarian"
+
+# str-valued Enum generated from the shared list (member.value == member.name)
+DietaryRestriction = Enum(
+    "DietaryRestriction",
+    {name: name for name in DIETARY_RESTRICTIONS},
+    type=str,
+)
 
 
 class ReservationAttendeeBase(BaseModel):
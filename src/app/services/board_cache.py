@@ -0,0 +1,208 @@
+# app/services/board_cache.py
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import date
+from typing import Dict, Hashable, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.http_cache import etag_for_bytes
+from app.models.dining_room import DiningRoom
+from app.models.member import Member
+from app.models.message import Message
+from app.models.order import Order
+from app.models.order_item import OrderItem
+from app.models.reservation import Reservation
+from app.models.reservation_attendee import ReservationAttendee
+from app.models.seat_assignment import SeatAssignment
+from app.models.table import Table
+from app.services.daily_board import daily_board_json
+
+# Daily-board documents (services.daily_board) cached as bytes + ETag, so the
+# devices polling one date during service cost one query between writes.
+#
+# Entries are keyed (date, user_id) because unread counts are per user, and
+# are invalidated by date: committed flushes are mapped to the reservation
+# dates they touched (see the Session hooks below). Set-based DML against
+# board tables can't be mapped to dates cheaply and clears everything.
+
+# Backstop for writes made outside this process (scripts, psql)
+MAX_AGE_SECONDS = 60
+MAX_ENTRIES = 256
+
+# Rows whose changes show up on some date's board
+_BY_RESERVATION_ID = (ReservationAttendee, Message, SeatAssignment)
+# Shown on boards but not tied to one date: changes clear the whole cache
+_GLOBAL = (Member, Table, DiningRoom)
+_BOARD_TABLES = frozenset(
+    m.__table__.name
+    for m in (Reservation, Order, OrderItem, *_BY_RESERVATION_ID, *_GLOBAL)
+)
+
+_INFO_KEY = "board_cache_dirty"
+_ALL = "all"
+
+
+class _Entry(NamedTuple):
+    built_at: float
+    body: bytes
+    etag: str
+
+
+class BoardCache:
+    """
+    invalidate() drops the matching entries at once and stamps the keys
+    with a logical clock. A reader notes the clock when it starts building
+    and only stores its result if no stamp for its keys is newer, so a
+    board read before a commit never outlives it. Stamps matter only while
+    a build that started before them is still running, and are pruned as
+    soon as none is.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clock = 0
+        self._cleared_at = 0
+        self._stamps: Dict[Hashable, int] = {}      # day or (day, user_id) → clock
+        self._building: Counter = Counter()         # start clock → builds in flight
+        self._entries: "OrderedDict[Tuple[date, int], _Entry]" = OrderedDict()
+
+    def get(self, db: Session, day: date, user_id: int) -> Tuple[bytes, str]:
+        """(JSON bytes, ETag) of the daily board for `day` as seen by `user_id`."""
+        key = (day, user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.built_at < MAX_AGE_SECONDS:
+                self._entries.move_to_end(key)
+                return entry.body, entry.etag
+            started = self._clock
+            self._building[started] += 1
+
+        try:
+            body = daily_board_json(db, day, user_id)
+        except BaseException:
+            with self._lock:
+                self._finish(started)
+            raise
+
+        entry = _Entry(time.monotonic(), body, etag_for_bytes(body))
+        with self._lock:
+            if max(self._cleared_at, self._stamps.get(day, 0), self._stamps.get(key, 0)) <= started:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > MAX_ENTRIES:
+                    self._entries.popitem(last=False)
+            self._finish(started)
+        return entry.body, entry.etag
+
+    def _finish(self, started: int) -> None:
+        # Caller holds the lock
+        self._building[started] -= 1
+        if not self._building[started]:
+            del self._building[started]
+        oldest = min(self._building, default=None)
+        if oldest is None:
+            self._stamps.clear()
+        else:
+            for k in [k for k, stamp in self._stamps.items() if stamp <= oldest]:
+                del self._stamps[k]
+
+    def invalidate(self, *days: date, user_id: Optional[int] = None) -> None:
+        """Drop boards for `days` (only `user_id`'s, when given). Call after commit."""
+        with self._lock:
+            self._clock += 1
+            targets = set(days) if user_id is None else {(day, user_id) for day in days}
+            for key in [k for k in self._entries if k[0] in targets or k in targets]:
+                del self._entries[key]
+            if self._building:
+                for target in targets:
+                    self._stamps[target] = self._clock
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clock += 1
+            self._cleared_at = self._clock
+            self._stamps.clear()
+            self._entries.clear()
+
+
+board_cache = BoardCache()
+
+
+# ── Write tracking ──────────────────────────────────────────
+#
+# after_flush maps every flushed object to reservation dates while the rows
+# are still readable in the transaction; the dates are held on the session
+# and only invalidated once the transaction commits.
+
+def _pending(session: Session) -> Set:
+    return session.info.setdefault(_INFO_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_board_dates(session: Session, flush_context) -> None:
+    pending = _pending(session)
+    if _ALL in pending:
+        return
+
+    reservation_ids: Set[int] = set()
+    attendee_ids: Set[int] = set()
+    order_ids: Set[int] = set()
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Reservation):
+            history = inspect(obj).attrs.date.history
+            pending.update(d for d in (*history.unchanged, *history.added, *history.deleted) if d)
+        elif isinstance(obj, _BY_RESERVATION_ID):
+            reservation_ids.add(obj.reservation_id)
+        elif isinstance(obj, Order):
+            attendee_ids.add(obj.attendee_id)
+        elif isinstance(obj, OrderItem):
+            order_ids.add(obj.order_id)
+        elif isinstance(obj, _GLOBAL):
+            pending.add(_ALL)
+            return
+
+    conn = session.connection()
+    if order_ids:
+        attendee_ids.update(conn.execute(
+            select(Order.attendee_id).where(Order.id.in_(order_ids))
+        ).scalars())
+    if attendee_ids:
+        reservation_ids.update(conn.execute(
+            select(ReservationAttendee.reservation_id)
+            .where(ReservationAttendee.id.in_(attendee_ids))
+        ).scalars())
+    reservation_ids.discard(None)
+    if reservation_ids:
+        pending.update(conn.execute(
+            select(Reservation.date).where(Reservation.id.in_(reservation_ids))
+        ).scalars())
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_dml(state: ORMExecuteState) -> None:
+    if (state.is_insert or state.is_update or state.is_delete) and (
+        state.statement.table.name in _BOARD_TABLES
+    ):
+        _pending(state.session).add(_ALL)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_board_dates(session: Session) -> None:
+    pending = session.info.pop(_INFO_KEY, None)
+    if not pending:
+        return
+    if _ALL in pending:
+        board_cache.clear()
+    else:
+        board_cache.invalidate(*pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_board_dates(session: Session) -> None:
+    session.info.pop(_INFO_KEY, None)
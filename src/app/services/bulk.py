@@ -0,0 +1,79 @@
+# app/services/bulk.py
+from __future__ import annotations
+
+from typing import Dict, Optional, Type, TypeVar
+
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session
+
+from app.models.dining_room import DiningRoom
+from app.models.member import Member
+from app.models.reservation_attendee import ReservationAttendee
+from app.models.seat_assignment import SeatAssignment
+from app.models.table import Table
+
+# Set-based replacements for ORM cascades. Each operation is a fixed number of
+# UPDATE ... FROM / DELETE ... WHERE statements regardless of how many child
+# rows exist, so nothing is loaded into the session and row locks are held
+# only for the statements themselves. Callers commit.
+#
+# synchronize_session=False: objects already in the session are not patched
+# up — these run at the end of a request, right before commit.
+
+_NO_SYNC = {"synchronize_session": False}
+
+M = TypeVar("M")
+
+
+def _run(db: Session, stmt) -> int:
+    return db.execute(stmt, execution_options=_NO_SYNC).rowcount
+
+
+def delete_member(db: Session, member_id: int) -> Dict[str, int]:
+    """
+    Detach the member's attendee rows (keeping the name as guest_name — the
+    check constraint needs member_id or guest_name), then delete the member.
+    """
+    detached = _run(
+        db,
+        update(ReservationAttendee)
+        .where(
+            ReservationAttendee.member_id == Member.id,
+            Member.id == member_id,
+        )
+        .values(guest_name=Member.name, member_id=None),
+    )
+    deleted = _run(db, delete(Member).where(Member.id == member_id))
+    return {"attendees_detached": detached, "members": deleted}
+
+
+def delete_table(db: Session, table_id: int) -> Dict[str, int]:
+    """Delete a table and every seat assignment on it."""
+    assignments = _run(db, delete(SeatAssignment).where(SeatAssignment.table_id == table_id))
+    tables = _run(db, delete(Table).where(Table.id == table_id))
+    return {"seat_assignments": assignments, "tables": tables}
+
+
+def delete_dining_room(db: Session, room_id: int) -> Dict[str, int]:
+    """Delete a room, its tables and their seat assignments."""
+    assignments = _run(
+        db,
+        delete(SeatAssignment).where(
+            SeatAssignment.table_id == Table.id,
+            Table.dining_room_id == room_id,
+        ),
+    )
+    tables = _run(db, delete(Table).where(Table.dining_room_id == room_id))
+    rooms = _run(db, delete(DiningRoom).where(DiningRoom.id == room_id))
+    return {"seat_assignments": assignments, "tables": tables, "dining_rooms": rooms}
+
+
+def toggle_active(db: Session, model: Type[M], row_id: int) -> Optional[M]:
+    """Flip is_active in one UPDATE ... RETURNING; None if the row doesn't exist."""
+    return db.execute(
+        update(model)
+        .where(model.id == row_id)
+        .values(is_active=~model.is_active)
+        .returning(model),
+        execution_options={"populate_existing": True},
+    ).scalar_one_or_none()
@@ -0,0 +1,182 @@
+# app/services/daily_board.py
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import Text, case, cast, func, literal, null, select, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session, aliased
+
+from app.models.dining_room import DiningRoom
+from app.models.member import Member
+from app.models.menu_item_version import MenuItemVersion
+from app.models.message_read_cursor import message_counts_query
+from app.models.order import Order
+from app.models.order_item import OrderItem
+from app.models.reservation import Reservation
+from app.models.reservation_attendee import ReservationAttendee
+from app.models.seat_assignment import SeatAssignment
+from app.models.table import Table
+
+# The admin daily board (GET /admin/daily) assembled entirely in Postgres:
+# one statement returns the finished JSON document as text, which is sent
+# as-is. No ORM objects, no Python dict building, no jsonable_encoder.
+#
+# Shape is the one the board has always had; nested lists come from
+# correlated json_agg subqueries, so each reservation costs index lookups,
+# not extra round trips. Lists are ordered by id so output is stable.
+
+_EMPTY = text("'[]'::json")
+
+
+def _json_list(expr, *order_by):
+    return func.coalesce(func.json_agg(aggregate_order_by(expr, *order_by)), _EMPTY)
+
+
+def _items_json():
+    return (
+        select(_json_list(
+            func.json_build_object(
+                "id", OrderItem.id,
+                "name_snapshot", MenuItemVersion.name,
+                "price_cents_snapshot", MenuItemVersion.price_cents,
+                "quantity", OrderItem.quantity,
+                "status", OrderItem.status,
+            ),
+            OrderItem.id,
+        ))
+        .select_from(OrderItem)
+        .join(MenuItemVersion, MenuItemVersion.id == OrderItem.menu_item_version_id)
+        .where(OrderItem.order_id == Order.id)
+        .correlate(Order)
+        .scalar_subquery()
+    )
+
+
+def _orders_json():
+    a = aliased(ReservationAttendee)
+    item_count = (
+        select(func.count())
+        .where(OrderItem.order_id == Order.id)
+        .correlate(Order)
+        .scalar_subquery()
+    )
+    return (
+        select(_json_list(
+            func.json_build_object(
+                "id", Order.id,
+                "status", Order.status,
+                "item_count", item_count,
+                "items", _items_json(),
+            ),
+            a.id,
+        ))
+        .select_from(Order)
+        .join(a, a.id == Order.attendee_id)
+        .where(a.reservation_id == Reservation.id)
+        .correlate(Reservation)
+        .scalar_subquery()
+    )
+
+
+def _attendees_json():
+    a = aliased(ReservationAttendee)
+    m = aliased(Member)
+    return (
+        select(_json_list(
+            func.json_build_object(
+                "id", a.id,
+                "member_id", a.member_id,
+                "guest_name", a.guest_name,
+                "member", case((m.id.is_not(None), func.json_build_object("name", m.name))),
+                "dietary_restrictions", a.dietary_restrictions,
+            ),
+            a.id,
+        ))
+        .select_from(a)
+        .outerjoin(m, m.id == a.member_id)
+        .where(a.reservation_id == Reservation.id)
+        .correlate(Reservation)
+        .scalar_subquery()
+    )
+
+
+def _primary_member():
+    # First attendee whose member is the Primary, else the first attendee
+    a = aliased(ReservationAttendee)
+    m = aliased(Member)
+    return (
+        select(case((m.id.is_not(None), m.name), else_=a.guest_name))
+        .select_from(a)
+        .outerjoin(m, m.id == a.member_id)
+        .where(a.reservation_id == Reservation.id)
+        .order_by(case((m.relation == "Primary", 0), else_=1), a.id)
+        .limit(1)
+        .correlate(Reservation)
+        .scalar_subquery()
+    )
+
+
+def _party_size():
+    return (
+        select(func.count())
+        .where(ReservationAttendee.reservation_id == Reservation.id)
+        .correlate(Reservation)
+        .scalar_subquery()
+    )
+
+
+def daily_board_json(db: Session, day: date, user_id: int) -> bytes:
+    """The daily board for `day` as JSON bytes; unread counts are for `user_id`."""
+    counts = message_counts_query(
+        user_id, select(Reservation.id).where(Reservation.date == day)
+    ).subquery("counts")
+
+    reservation = func.json_build_object(
+        "reservation_id", Reservation.id,
+        "user_id", Reservation.user_id,
+        "date", Reservation.date,
+        "start_time", Reservation.start_time,
+        "end_time", Reservation.end_time,
+        "status", Reservation.status,
+        "notes", Reservation.notes,
+        "meal_type", null(),
+        "dining_room_id", Reservation.dining_room_id,
+        "dining_room", case((DiningRoom.id.is_not(None), func.json_build_object("name", DiningRoom.name))),
+        "dining_room_name", DiningRoom.name,
+        "primary_member", _primary_member(),
+        "party_size", _party_size(),
+        "table", case((Table.id.is_not(None), func.json_build_object(
+            "table_id", Table.id,
+            "table_name", Table.name,
+            "seat_count", Table.seat_count,
+        ))),
+        "message_count", func.coalesce(counts.c.total, 0),
+        "unread_message_count", func.coalesce(counts.c.unread, 0),
+        "attendees", _attendees_json(),
+        "orders", _orders_json(),
+    )
+
+    rows = (
+        select(
+            reservation.label("doc"),
+            Reservation.start_time.label("start_time"),
+            Reservation.id.label("id"),
+        )
+        .select_from(Reservation)
+        .outerjoin(DiningRoom, DiningRoom.id == Reservation.dining_room_id)
+        .outerjoin(SeatAssignment, SeatAssignment.reservation_id == Reservation.id)
+        .outerjoin(Table, Table.id == SeatAssignment.table_id)
+        .outerjoin(counts, counts.c.reservation_id == Reservation.id)
+        .where(Reservation.date == day)
+        .subquery("rows")
+    )
+
+    document = func.json_build_object(
+        "date", literal(day),
+        "reservations", _json_list(rows.c.doc, rows.c.start_time, rows.c.id),
+        "total", func.count(rows.c.id),
+    )
+    # Cast to text: the driver would otherwise parse the JSON back into dicts
+    body = db.execute(select(cast(document, Text)).select_from(rows)).scalar_one()
+    return body.encode("utf-8")
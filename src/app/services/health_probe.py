@@ -0,0 +1,128 @@
+# app/services/health_probe.py
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from app.core.config import get_settings
+from app.database import MAX_OVERFLOW, POOL_SIZE, engine
+
+settings = get_settings()
+
+# Readiness is computed off the request path: a daemon thread started in the
+# app lifespan checks the database every PROBE_INTERVAL_SECONDS and keeps
+# the latest result. /health/ready only reads it (and the pool's counters),
+# so probes never wait on, or take, a pooled connection, even at peak.
+#
+# The prober connects through its own unpooled engine: a saturated request
+# pool is reported as such, but never blocks or fails the database check.
+
+PROBE_INTERVAL_SECONDS = 5.0
+# A result older than this means the prober itself is stuck (e.g. a connect
+# that never completes): not ready.
+STALE_AFTER_SECONDS = 30.0
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+
+# One short-lived connection per probe, outside the app's pool
+probe_engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+
+
+class ProbeResult(NamedTuple):
+    checked_at: float               # time.monotonic()
+    checked_at_utc: str
+    database_ok: bool
+    latency_ms: Optional[int]
+    error: Optional[str]
+    current_heads: Optional[List[str]]   # None when alembic_version is unreadable
+
+
+def expected_heads() -> List[str]:
+    """Head revision(s) of the migration scripts shipped with this build."""
+    cfg = Config()
+    cfg.set_main_option("script_location", str(ALEMBIC_DIR))
+    cfg.set_main_option("version_locations", str(ALEMBIC_DIR / "versions"))
+    return sorted(ScriptDirectory.from_config(cfg).get_heads())
+
+
+def pool_stats() -> Dict[str, Any]:
+    """
+    Request-pool counters; reading them doesn't touch a connection.
+    Informational: a saturated pool slows requests but the app is still up.
+    """
+    checked_out = engine.pool.checkedout()
+    capacity = POOL_SIZE + MAX_OVERFLOW
+    return {
+        "status": "saturated" if checked_out >= capacity else "ok",
+        "checked_out": checked_out,
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 2),
+    }
+
+
+class HealthProber:
+    def __init__(self) -> None:
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.latest: Optional[ProbeResult] = None
+        self.expected_heads: Optional[List[str]] = None
+        self.heads_error: Optional[str] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        try:
+            self.expected_heads = expected_heads()
+        except Exception as e:
+            self.heads_error = str(e)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="health-prober", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=PROBE_INTERVAL_SECONDS)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.latest = self.probe()
+            self._stop.wait(PROBE_INTERVAL_SECONDS)
+
+    def probe(self) -> ProbeResult:
+        heads: Optional[List[str]] = None
+        try:
+            with probe_engine.connect() as conn:
+                t0 = time.perf_counter()
+                conn.execute(text("SELECT 1"))
+                latency_ms = int((time.perf_counter() - t0) * 1000)
+                try:
+                    heads = sorted(
+                        conn.execute(text("SELECT version_num FROM alembic_version")).scalars()
+                    )
+                except Exception:
+                    heads = None
+        except Exception as e:
+            return ProbeResult(time.monotonic(), _utc_now_iso(), False, None, str(e), None)
+        return ProbeResult(time.monotonic(), _utc_now_iso(), True, latency_ms, None, heads)
+
+    def age_seconds(self) -> Optional[float]:
+        latest = self.latest
+        return None if latest is None else time.monotonic() - latest.checked_at
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+health_prober = HealthProber()
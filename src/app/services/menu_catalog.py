@@ -0,0 +1,177 @@
+# app/services/menu_catalog.py
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from typing import List, NamedTuple, Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
+
+from app.core.http_cache import etag_for_bytes
+from app.models.menu_item import MenuItem
+from app.models.menu_item_version import MenuItemVersion, ensure_menu_item_version
+from app.schemas.menu_item import MenuCategory, MenuItemResponse, MenuResponse
+
+# Backstop for writes made outside this process (scripts/data importers, psql).
+# In-app writes call invalidate() and are visible on the next request.
+MAX_AGE_SECONDS = 300
+
+_menu_list = TypeAdapter(List[MenuItemResponse])
+
+
+class MenuSnapshot(NamedTuple):
+    """What an order line needs from a menu item: version, allergen mask, display fields."""
+    id: int
+    name: str
+    price_cents: int
+    is_active: bool
+    dietary_mask: int
+    version_id: Optional[int]   # None until a version row exists for (name, price)
+
+
+class _Built(NamedTuple):
+    version: int
+    built_at: float
+    items: dict[int, MenuSnapshot]
+    active_json: bytes
+    etag: str
+    grouped_json: bytes
+    grouped_etag: str
+
+
+def _grouped(items: List[MenuItemResponse]) -> MenuResponse:
+    """Group name-ordered items by category; categories A→Z, uncategorized last."""
+    by_category: dict[Optional[str], List[MenuItemResponse]] = {}
+    for item in items:
+        by_category.setdefault(item.category, []).append(item)
+
+    categories = [
+        MenuCategory(
+            category=category,
+            item_count=len(members),
+            dietary_counts=dict(sorted(
+                Counter(tag for m in members for tag in m.dietary_restrictions).items()
+            )),
+            items=members,
+        )
+        for category, members in sorted(
+            by_category.items(), key=lambda kv: (kv[0] is None, (kv[0] or "").lower())
+        )
+    ]
+    return MenuResponse(
+        item_count=len(items),
+        dietary_counts=dict(sorted(
+            Counter(tag for m in items for tag in m.dietary_restrictions).items()
+        )),
+        categories=categories,
+    )
+
+
+class MenuCatalog:
+    """
+    In-process cache of the menu: the public active list and the
+    category-grouped menu as pre-serialized JSON bytes (+ ETags), and an
+    id → snapshot map for order lines.
+
+    Writers bump `version` after commit; readers rebuild lazily when the
+    version they were built for is stale. The rebuild runs under a lock so a
+    burst of requests after an edit triggers one query, not one per request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()           # serializes rebuilds
+        self._version_lock = threading.Lock()   # writers never wait on a rebuild
+        self._version = 0
+        self._built: Optional[_Built] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self) -> None:
+        """Call after committing any change to menu_items."""
+        with self._version_lock:
+            self._version += 1
+
+    def _fresh(self, built: Optional[_Built]) -> bool:
+        return (
+            built is not None
+            and built.version == self._version
+            and time.monotonic() - built.built_at < MAX_AGE_SECONDS
+        )
+
+    def _get(self, db: Session) -> _Built:
+        built = self._built
+        if self._fresh(built):
+            return built
+        with self._lock:
+            built = self._built
+            if self._fresh(built):
+                return built
+            # Capture the version before reading: an invalidate() that lands
+            # mid-build leaves this entry stale and the next reader rebuilds.
+            version = self._version
+            result = db.execute(
+                select(MenuItem, MenuItemVersion.id)
+                .outerjoin(MenuItemVersion, and_(
+                    MenuItemVersion.menu_item_id == MenuItem.id,
+                    MenuItemVersion.name == MenuItem.name,
+                    MenuItemVersion.price_cents == MenuItem.price_cents,
+                ))
+                .order_by(MenuItem.name.asc())
+            ).all()
+            rows = [r for r, _ in result]
+            active = _menu_list.validate_python(
+                [r for r in rows if r.is_active], from_attributes=True
+            )
+            body = _menu_list.dump_json(active)
+            grouped = _grouped(active).model_dump_json().encode("utf-8")
+            built = _Built(
+                version=version,
+                built_at=time.monotonic(),
+                items={
+                    r.id: MenuSnapshot(
+                        r.id, r.name, r.price_cents, r.is_active, r.dietary_mask, version_id
+                    )
+                    for r, version_id in result
+                },
+                active_json=body,
+                etag=etag_for_bytes(body),
+                grouped_json=grouped,
+                grouped_etag=etag_for_bytes(grouped),
+            )
+            self._built = built
+            return built
+
+    def active_json(self, db: Session) -> tuple[bytes, str]:
+        """(JSON bytes, ETag) for the active menu ordered by name."""
+        built = self._get(db)
+        return built.active_json, built.etag
+
+    def grouped_json(self, db: Session) -> tuple[bytes, str]:
+        """(JSON bytes, ETag) for the active menu grouped by category (MenuResponse)."""
+        built = self._get(db)
+        return built.grouped_json, built.grouped_etag
+
+    def get_item(self, db: Session, menu_item_id: int) -> Optional[MenuSnapshot]:
+        snapshot = self._get(db).items.get(menu_item_id)
+        if snapshot is None:
+            # Created elsewhere since the last build; don't wait out MAX_AGE.
+            row = db.get(MenuItem, menu_item_id)
+            if row is not None:
+                snapshot = MenuSnapshot(
+                    row.id, row.name, row.price_cents, row.is_active, row.dietary_mask, None
+                )
+        return snapshot
+
+    def version_id_for(self, db: Session, snapshot: MenuSnapshot) -> int:
+        """Version row for the snapshot's (name, price); created on first use if missing."""
+        if snapshot.version_id is not None:
+            return snapshot.version_id
+        return ensure_menu_item_version(db, snapshot.id, snapshot.name, snapshot.price_cents)
+
+
+menu_catalog = MenuCatalog()
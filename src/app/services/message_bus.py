@@ -0,0 +1,90 @@
+# app/services/message_bus.py
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Hashable, Set, Tuple
+
+# In-process wake-ups for message long-polls (single uvicorn worker: every
+# writer and every waiter share this process).
+#
+# Each topic has a sequence number bumped by publish(). Readers take the
+# sequence BEFORE querying, then wait(topic, seq): a publish that lands
+# between the query and the wait changes the sequence and the wait returns
+# at once, so no message is ever missed and idle waiters never touch the DB.
+#
+# Sequences come from one process-wide clock, so they only ever grow. The
+# map keeps the MAX_TOPICS most recently published topics; an evicted
+# topic reads as the highest evicted sequence (the floor), which is still
+# past anything a reader could have seen for it. At worst a reader of a
+# quiet topic wakes once for nothing and re-queries.
+
+Topic = Tuple[str, Hashable]
+
+MAX_TOPICS = 1024
+
+
+def reservation_topic(reservation_id: int) -> Topic:
+    return ("reservation", reservation_id)
+
+
+def date_topic(day: date) -> Topic:
+    return ("date", day)
+
+
+class MessageBus:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()   # publish() runs on threadpool workers
+        self._clock = 0
+        self._floor = 0                 # highest sequence evicted from _seq
+        self._seq: "OrderedDict[Topic, int]" = OrderedDict()
+        self._waiters: Dict[Topic, Set[asyncio.Future]] = {}
+
+    def sequence(self, topic: Topic) -> int:
+        with self._lock:
+            return self._seq.get(topic, self._floor)
+
+    def publish(self, *topics: Topic) -> None:
+        """Call after commit. Safe from any thread."""
+        woken = []
+        with self._lock:
+            for topic in topics:
+                self._clock += 1
+                self._seq[topic] = self._clock
+                self._seq.move_to_end(topic)
+                woken.extend(self._waiters.pop(topic, ()))
+            while len(self._seq) > MAX_TOPICS:
+                _, evicted = self._seq.popitem(last=False)
+                self._floor = max(self._floor, evicted)
+        for fut in woken:
+            fut.get_loop().call_soon_threadsafe(_resolve, fut)
+
+    async def wait(self, topic: Topic, seen: int, timeout: float) -> bool:
+        """Wait until `topic` moves past `seen`. False on timeout."""
+        fut = asyncio.get_running_loop().create_future()
+        with self._lock:
+            if self._seq.get(topic, self._floor) != seen:
+                return True
+            self._waiters.setdefault(topic, set()).add(fut)
+        try:
+            await asyncio.wait_for(fut, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(topic)
+                if waiters is not None:
+                    waiters.discard(fut)
+                    if not waiters:
+                        del self._waiters[topic]
+
+
+def _resolve(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+message_bus = MessageBus()
@@ -0,0 +1,83 @@
+# app/services/single_flight.py
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+# Request coalescing for hot read routes. When identical requests arrive
+# while one is already being computed, the later ones wait for that result
+# instead of running the same queries again: a burst of N polls costs one
+# pooled connection, not N (followers release theirs before waiting).
+#
+# Nothing is kept after the call finishes (caching is the caller's job).
+# Results are shared across threads, so flights should return immutable
+# values — serialized bytes, not ORM objects bound to the leader's session.
+
+T = TypeVar("T")
+
+# A follower stops waiting on a stuck leader and runs the call itself
+FOLLOWER_TIMEOUT_SECONDS = 30.0
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()   # sync routes run on threadpool workers
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T], session: Optional[Session] = None) -> T:
+        """
+        Run fn(), or wait for the in-flight call with the same key and share
+        its outcome. Pass the request's `session`: a follower closes it
+        before waiting, so the connection it holds (auth has already queried
+        by then) goes back to the pool. Build `key` first; loaded objects
+        stay readable after close.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if session is not None:
+                session.close()
+            if not call.done.wait(FOLLOWER_TIMEOUT_SECONDS):
+                return fn()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+def request_key(request: Request, scope: Hashable) -> Tuple[str, Tuple[Tuple[str, str], ...], Hashable]:
+    """
+    Key for a read whose result depends only on path, query string and
+    `scope` — whatever part of the caller's identity the response varies
+    by (a role, a user id, None for public data).
+    """
+    return (request.url.path, tuple(sorted(request.query_params.multi_items())), scope)
+
+
+single_flight = SingleFlight()
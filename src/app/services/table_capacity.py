@@ -0,0 +1,52 @@
+# app/services/table_capacity.py
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.table import Table
+
+# Largest active table, which caps party size in the frontend schema
+# (GET /schema). Cached in-process; the table endpoints call invalidate()
+# after commit.
+
+# Backstop for writes made outside this process (scripts, psql)
+MAX_AGE_SECONDS = 300
+
+# When no active tables exist
+DEFAULT_MAX_PARTY_SIZE = 4
+
+
+class TableCapacity:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._version = 0
+        self._cached: Optional[Tuple[int, float, int]] = None   # (version, built_at, value)
+
+    def invalidate(self) -> None:
+        """Call after committing any change to tables."""
+        with self._lock:
+            self._version += 1
+
+    def max_party_size(self, db: Session) -> int:
+        cached = self._cached
+        if (
+            cached is not None
+            and cached[0] == self._version
+            and time.monotonic() - cached[1] < MAX_AGE_SECONDS
+        ):
+            return cached[2]
+        # Capture before reading so an invalidate() mid-query leaves this stale
+        version = self._version
+        value = db.execute(
+            select(func.max(Table.seat_count)).where(Table.is_active.is_(True))
+        ).scalar() or DEFAULT_MAX_PARTY_SIZE
+        self._cached = (version, time.monotonic(), value)
+        return value
+
+
+table_capacity = TableCapacity()